@@ -4,7 +4,7 @@
  * for testing the analytics and insights features
  */
 
-import { createClient } from '@supabase/supabase-js'
+import { createClient, type SupabaseClient } from '@supabase/supabase-js'
 import dotenv from 'dotenv'
 
 // Load environment variables
@@ -27,127 +27,65 @@ export interface ClaudeChatLog {
   completed_at: string | null
 }
 
-// Supabase client (you'll need to set up environment variables)
-const supabaseUrl = process.env.VITE_SUPABASE_URL || 'your-supabase-url'
-const supabaseServiceKey = process.env.SUPABASE_SERVICE_KEY || process.env.VITE_SUPABASE_ANON_KEY || 'your-service-key'
+// A generated conversation row; id and audit timestamps are filled in by the database.
+// Rows are always built by generateConversation with the same key order, so they share one object shape.
+export type MockConversation = Omit<ClaudeChatLog, 'id' | 'created_at' | 'updated_at'>
 
-const supabase = createClient(supabaseUrl, supabaseServiceKey, {
-  auth: {
-    autoRefreshToken: false,
-    persistSession: false
+// Supabase credentials, read once when the module loads
+const supabaseUrl = process.env.VITE_SUPABASE_URL
+const supabaseServiceKey = process.env.SUPABASE_SERVICE_KEY || process.env.VITE_SUPABASE_ANON_KEY
+
+// Created on first upload so generating a dataset does not require credentials
+let supabaseClient: SupabaseClient | null = null
+
+function getSupabaseClient(): SupabaseClient {
+  if (supabaseClient) return supabaseClient
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    throw new Error('Missing Supabase environment variables: set VITE_SUPABASE_URL and SUPABASE_SERVICE_KEY')
   }
-})
+
+  supabaseClient = createClient(supabaseUrl, supabaseServiceKey, {
+    auth: {
+      autoRefreshToken: false,
+      persistSession: false
+    }
+  })
+  return supabaseClient
+}
+
+interface TeamMember {
+  id: string
+  anonymousId: string
+  name: string
+  title: string
+  type: string
+  projectFocus: string[]
+  style: string
+}
+
+/**
+ * Builds a team member record; ids are derived from the name (e.g. user_sarah_chen)
+ */
+function teamMember(name: string, title: string, type: string, projectFocus: string[], style: string): TeamMember {
+  const slug = name.toLowerCase().replace(/ /g, '_')
+  return { id: `user_${slug}`, anonymousId: `anon_${slug}`, name, title, type, projectFocus, style }
+}
 
 // Real team members with names and titles
-const teamMembers = [
-  {
-    id: 'user_sarah_chen',
-    anonymousId: 'anon_sarah_chen',
-    name: 'Sarah Chen',
-    title: 'Junior Frontend Developer',
-    type: 'junior_frontend',
-    projectFocus: ['react', 'vue', 'css', 'javascript'],
-    style: 'curious_learner'
-  },
-  {
-    id: 'user_marcus_rodriguez',
-    anonymousId: 'anon_marcus_rodriguez',
-    name: 'Marcus Rodriguez',
-    title: 'Senior Backend Engineer',
-    type: 'senior_backend',
-    projectFocus: ['nodejs', 'python', 'databases', 'apis'],
-    style: 'precise_technical'
-  },
-  {
-    id: 'user_alex_kim',
-    anonymousId: 'anon_alex_kim',
-    name: 'Alex Kim',
-    title: 'Engineering Team Lead',
-    type: 'tech_lead',
-    projectFocus: ['architecture', 'performance', 'team', 'devops'],
-    style: 'strategic_thinking'
-  },
-  {
-    id: 'user_priya_patel',
-    anonymousId: 'anon_priya_patel',
-    name: 'Priya Patel',
-    title: 'Mobile Developer',
-    type: 'mobile_developer',
-    projectFocus: ['react_native', 'ios', 'android', 'flutter'],
-    style: 'platform_focused'
-  },
-  {
-    id: 'user_james_wright',
-    anonymousId: 'anon_james_wright',
-    name: 'James Wright',
-    title: 'DevOps Engineer',
-    type: 'devops_engineer',
-    projectFocus: ['kubernetes', 'aws', 'docker', 'ci_cd'],
-    style: 'infrastructure_minded'
-  },
-  {
-    id: 'user_emily_zhang',
-    anonymousId: 'anon_emily_zhang',
-    name: 'Emily Zhang',
-    title: 'Data Scientist',
-    type: 'data_scientist',
-    projectFocus: ['python', 'machine_learning', 'data_analysis', 'statistics'],
-    style: 'analytical_approach'
-  },
-  {
-    id: 'user_david_johnson',
-    anonymousId: 'anon_david_johnson',
-    name: 'David Johnson',
-    title: 'Junior Backend Developer',
-    type: 'junior_backend',
-    projectFocus: ['python', 'django', 'databases', 'testing'],
-    style: 'methodical_learner'
-  },
-  {
-    id: 'user_lisa_thompson',
-    anonymousId: 'anon_lisa_thompson',
-    name: 'Lisa Thompson',
-    title: 'Security Engineer',
-    type: 'security_engineer',
-    projectFocus: ['security', 'authentication', 'encryption', 'compliance'],
-    style: 'security_first'
-  },
-  {
-    id: 'user_ryan_murphy',
-    anonymousId: 'anon_ryan_murphy',
-    name: 'Ryan Murphy',
-    title: 'Full Stack Developer',
-    type: 'fullstack_developer',
-    projectFocus: ['react', 'nodejs', 'databases', 'apis'],
-    style: 'versatile_problem_solver'
-  },
-  {
-    id: 'user_maria_gonzalez',
-    anonymousId: 'anon_maria_gonzalez',
-    name: 'Maria Gonzalez',
-    title: 'Senior Frontend Engineer',
-    type: 'senior_frontend',
-    projectFocus: ['react', 'typescript', 'performance', 'accessibility'],
-    style: 'detail_oriented'
-  },
-  {
-    id: 'user_kevin_lee',
-    anonymousId: 'anon_kevin_lee',
-    name: 'Kevin Lee',
-    title: 'Product Engineer',
-    type: 'product_engineer',
-    projectFocus: ['user_experience', 'analytics', 'a_b_testing', 'product_metrics'],
-    style: 'user_focused'
-  },
-  {
-    id: 'user_jordan_davis',
-    anonymousId: 'anon_jordan_davis',
-    name: 'Jordan Davis',
-    title: 'Platform Engineer',
-    type: 'platform_engineer',
-    projectFocus: ['infrastructure', 'tooling', 'developer_experience', 'automation'],
-    style: 'efficiency_focused'
-  }
+const teamMembers: TeamMember[] = [
+  teamMember('Sarah Chen', 'Junior Frontend Developer', 'junior_frontend', ['react', 'vue', 'css', 'javascript'], 'curious_learner'),
+  teamMember('Marcus Rodriguez', 'Senior Backend Engineer', 'senior_backend', ['nodejs', 'python', 'databases', 'apis'], 'precise_technical'),
+  teamMember('Alex Kim', 'Engineering Team Lead', 'tech_lead', ['architecture', 'performance', 'team', 'devops'], 'strategic_thinking'),
+  teamMember('Priya Patel', 'Mobile Developer', 'mobile_developer', ['react_native', 'ios', 'android', 'flutter'], 'platform_focused'),
+  teamMember('James Wright', 'DevOps Engineer', 'devops_engineer', ['kubernetes', 'aws', 'docker', 'ci_cd'], 'infrastructure_minded'),
+  teamMember('Emily Zhang', 'Data Scientist', 'data_scientist', ['python', 'machine_learning', 'data_analysis', 'statistics'], 'analytical_approach'),
+  teamMember('David Johnson', 'Junior Backend Developer', 'junior_backend', ['python', 'django', 'databases', 'testing'], 'methodical_learner'),
+  teamMember('Lisa Thompson', 'Security Engineer', 'security_engineer', ['security', 'authentication', 'encryption', 'compliance'], 'security_first'),
+  teamMember('Ryan Murphy', 'Full Stack Developer', 'fullstack_developer', ['react', 'nodejs', 'databases', 'apis'], 'versatile_problem_solver'),
+  teamMember('Maria Gonzalez', 'Senior Frontend Engineer', 'senior_frontend', ['react', 'typescript', 'performance', 'accessibility'], 'detail_oriented'),
+  teamMember('Kevin Lee', 'Product Engineer', 'product_engineer', ['user_experience', 'analytics', 'a_b_testing', 'product_metrics'], 'user_focused'),
+  teamMember('Jordan Davis', 'Platform Engineer', 'platform_engineer', ['infrastructure', 'tooling', 'developer_experience', 'automation'], 'efficiency_focused')
 ]
 
 // Project templates with different characteristics
@@ -325,54 +263,83 @@ const timePatterns = {
   weekend: [10, 14, 16, 19] // Weekend project work
 }
 
+// Working hours per persona type, resolved on first use and reused for every record
+const hoursByUserType = new Map<string, number[]>()
+const extendedHours = [...timePatterns.workday, ...timePatterns.late_night]
+
+function workingHoursFor(userType: string): number[] {
+  let hours = hoursByUserType.get(userType)
+  if (!hours) {
+    // Different personas have different working patterns
+    if (userType.includes('junior')) {
+      hours = timePatterns.workday // Junior devs tend to work normal hours
+    } else if (userType.includes('senior') || userType.includes('lead')) {
+      hours = extendedHours // More varied hours
+    } else {
+      hours = timePatterns.workday
+    }
+    hoursByUserType.set(userType, hours)
+  }
+  return hours
+}
+
 /**
- * Generates a realistic timestamp based on user persona and time patterns
+ * Returns local midnight for each of the last `days` days (index = days ago),
+ * so the per-conversation timestamp only has to set the time of day
  */
-function generateTimestamp(daysAgo: number, userType: string): Date {
-  const baseDate = new Date()
-  baseDate.setDate(baseDate.getDate() - daysAgo)
-
-  // Different personas have different working patterns
-  let hours: number[]
-  if (userType.includes('junior')) {
-    hours = timePatterns.workday // Junior devs tend to work normal hours
-  } else if (userType.includes('senior') || userType.includes('lead')) {
-    hours = [...timePatterns.workday, ...timePatterns.late_night] // More varied hours
-  } else {
-    hours = timePatterns.workday
-  }
+function buildDayStarts(days: number): number[] {
+  const today = new Date()
+  return Array.from({ length: days }, (_, daysAgo) => {
+    const day = new Date(today)
+    day.setDate(today.getDate() - daysAgo)
+    day.setHours(0, 0, 0, 0)
+    return day.getTime()
+  })
+}
+
+/**
+ * Generates a realistic timestamp (epoch ms) based on user persona and time patterns
+ */
+function generateTimestamp(dayStart: number, userType: string): number {
+  const hours = workingHoursFor(userType)
 
   const randomHour = hours[Math.floor(Math.random() * hours.length)]
   const randomMinute = Math.floor(Math.random() * 60)
 
-  baseDate.setHours(randomHour, randomMinute, 0, 0)
-  return baseDate
+  // setHours works in local time, so the hour stays correct on DST transition days
+  return new Date(dayStart).setHours(randomHour, randomMinute, 0, 0)
 }
 
+// Template weights per persona, shared across every generated conversation
+const typeWeights: Record<string, Record<string, number>> = {
+  junior_frontend: { learning: 0.4, debugging: 0.4, architecture: 0.1, code_review: 0.1 },
+  junior_backend: { learning: 0.4, debugging: 0.35, architecture: 0.15, code_review: 0.1 },
+  senior_backend: { architecture: 0.3, debugging: 0.25, code_review: 0.25, learning: 0.2 },
+  senior_frontend: { architecture: 0.25, debugging: 0.3, code_review: 0.3, learning: 0.15 },
+  tech_lead: { architecture: 0.4, code_review: 0.3, debugging: 0.2, learning: 0.1 },
+  mobile_developer: { debugging: 0.35, learning: 0.25, architecture: 0.25, code_review: 0.15 },
+  devops_engineer: { architecture: 0.35, debugging: 0.25, learning: 0.25, code_review: 0.15 },
+  data_scientist: { learning: 0.35, debugging: 0.25, architecture: 0.25, code_review: 0.15 },
+  security_engineer: { architecture: 0.3, code_review: 0.3, debugging: 0.25, learning: 0.15 },
+  fullstack_developer: { debugging: 0.3, architecture: 0.25, learning: 0.25, code_review: 0.2 },
+  product_engineer: { learning: 0.3, architecture: 0.25, debugging: 0.25, code_review: 0.2 },
+  platform_engineer: { architecture: 0.35, debugging: 0.25, code_review: 0.25, learning: 0.15 }
+}
+
+// Weight entries resolved once per persona rather than on every selection
+const typeWeightEntries: Record<string, Array<[string, number]>> = Object.fromEntries(
+  Object.entries(typeWeights).map(([type, weights]) => [type, Object.entries(weights)])
+)
+
 /**
  * Selects appropriate conversation template based on user persona
  */
 function selectConversationTemplate(userType: string): string {
-  const typeWeights = {
-    junior_frontend: { learning: 0.4, debugging: 0.4, architecture: 0.1, code_review: 0.1 },
-    junior_backend: { learning: 0.4, debugging: 0.35, architecture: 0.15, code_review: 0.1 },
-    senior_backend: { architecture: 0.3, debugging: 0.25, code_review: 0.25, learning: 0.2 },
-    senior_frontend: { architecture: 0.25, debugging: 0.3, code_review: 0.3, learning: 0.15 },
-    tech_lead: { architecture: 0.4, code_review: 0.3, debugging: 0.2, learning: 0.1 },
-    mobile_developer: { debugging: 0.35, learning: 0.25, architecture: 0.25, code_review: 0.15 },
-    devops_engineer: { architecture: 0.35, debugging: 0.25, learning: 0.25, code_review: 0.15 },
-    data_scientist: { learning: 0.35, debugging: 0.25, architecture: 0.25, code_review: 0.15 },
-    security_engineer: { architecture: 0.3, code_review: 0.3, debugging: 0.25, learning: 0.15 },
-    fullstack_developer: { debugging: 0.3, architecture: 0.25, learning: 0.25, code_review: 0.2 },
-    product_engineer: { learning: 0.3, architecture: 0.25, debugging: 0.25, code_review: 0.2 },
-    platform_engineer: { architecture: 0.35, debugging: 0.25, code_review: 0.25, learning: 0.15 }
-  }
-
-  const weights = typeWeights[userType as keyof typeof typeWeights] || typeWeights.junior_frontend
+  const weights = typeWeightEntries[userType] || typeWeightEntries.junior_frontend
   const random = Math.random()
   let cumulative = 0
 
-  for (const [template, weight] of Object.entries(weights)) {
+  for (const [template, weight] of weights) {
     cumulative += weight
     if (random <= cumulative) {
       return template
@@ -386,11 +353,11 @@ function selectConversationTemplate(userType: string): string {
  * Generates a single conversation pair
  */
 function generateConversation(
-  user: typeof userPersonas[0],
+  user: TeamMember,
   project: typeof projectTemplates[0],
   installation: string,
-  timestamp: Date
-): Omit<ClaudeChatLog, 'id' | 'created_at' | 'updated_at'> {
+  time: number
+): MockConversation {
   const templateType = selectConversationTemplate(user.type)
   const template = conversationTemplates[templateType as keyof typeof conversationTemplates]
 
@@ -400,7 +367,7 @@ function generateConversation(
   // Add some variation to responses to make them feel more natural
   const isCompleted = Math.random() > 0.05 // 95% completion rate
   const completedAt = isCompleted
-    ? new Date(timestamp.getTime() + Math.random() * 300000) // 0-5 minutes later
+    ? new Date(time + Math.random() * 300000) // 0-5 minutes later
     : null
 
   return {
@@ -408,7 +375,7 @@ function generateConversation(
     claude_response: template.claude_responses[responseIndex],
     user_id: user.id,
     project_id: project.id,
-    interaction_timestamp: timestamp.toISOString(),
+    interaction_timestamp: new Date(time).toISOString(),
     anonymous_user_id: user.anonymousId,
     project_name: project.name,
     installation_id: installation,
@@ -420,11 +387,13 @@ function generateConversation(
 /**
  * Generates the complete dataset
  */
-export function generateMockDataset(count: number = 500): Omit<ClaudeChatLog, 'id' | 'created_at' | 'updated_at'>[] {
-  const dataset: Omit<ClaudeChatLog, 'id' | 'created_at' | 'updated_at'>[] = []
+export function generateMockDataset(count: number = 500): MockConversation[] {
+  // Each conversation keeps its epoch ms so sorting never re-parses the ISO strings
+  const dataset: Array<{ time: number; conversation: MockConversation }> = []
 
   // Generate conversations over the past 90 days
   const maxDaysAgo = 90
+  const dayStarts = buildDayStarts(maxDaysAgo)
 
   for (let i = 0; i < count; i++) {
     // Select random team member and project
@@ -434,27 +403,53 @@ export function generateMockDataset(count: number = 500): Omit<ClaudeChatLog, 'i
 
     // Generate realistic timestamp (more recent conversations are more likely)
     const daysAgo = Math.floor(Math.random() * Math.random() * maxDaysAgo)
-    const timestamp = generateTimestamp(daysAgo, user.type)
+    const time = generateTimestamp(dayStarts[daysAgo], user.type)
 
-    const conversation = generateConversation(user, project, installation, timestamp)
-    dataset.push(conversation)
+    const conversation = generateConversation(user, project, installation, time)
+    dataset.push({ time, conversation })
   }
 
   // Sort by timestamp for more realistic data
-  return dataset.sort((a, b) =>
-    new Date(a.interaction_timestamp).getTime() - new Date(b.interaction_timestamp).getTime()
-  )
+  return dataset
+    .sort((a, b) => a.time - b.time)
+    .map(entry => entry.conversation)
 }
 
+// PostgREST error code for an RPC function that is not installed
+const FUNCTION_NOT_FOUND = 'PGRST202'
+// Postgres error code when the key's role may not execute the function (e.g. the anon key)
+const PERMISSION_DENIED = '42501'
+
 /**
- * Uploads dataset to Supabase in batches
+ * Uploads dataset to Supabase in a single transaction through the
+ * insert_chat_logs_bulk function, falling back to batched inserts when the
+ * function has not been installed (supabase-migrations/bulk_insert_chat_logs.sql)
+ * or the key in use is not allowed to execute it
  */
 export async function uploadToSupabase(
-  dataset: Omit<ClaudeChatLog, 'id' | 'created_at' | 'updated_at'>[],
-  batchSize: number = 50
+  dataset: MockConversation[],
+  batchSize: number = 500
 ): Promise<void> {
+  const supabase = getSupabaseClient()
   console.log(`Starting upload of ${dataset.length} conversations to Supabase...`)
 
+  const { data: insertedCount, error: rpcError } = await supabase
+    .rpc('insert_chat_logs_bulk', { logs: dataset })
+
+  if (!rpcError) {
+    console.log(`Successfully uploaded ${insertedCount ?? dataset.length} conversations to Supabase!`)
+    return
+  }
+
+  if (rpcError.code === FUNCTION_NOT_FOUND) {
+    console.log('insert_chat_logs_bulk is not installed, uploading in batches instead')
+  } else if (rpcError.code === PERMISSION_DENIED) {
+    console.log('Not allowed to execute insert_chat_logs_bulk (set SUPABASE_SERVICE_KEY), uploading in batches instead')
+  } else {
+    console.error('Bulk upload failed:', rpcError)
+    throw rpcError
+  }
+
   let uploaded = 0
   const totalBatches = Math.ceil(dataset.length / batchSize)
 
@@ -467,21 +462,27 @@ export async function uploadToSupabase(
         .insert(batch)
 
       if (error) {
-        console.error(`Error uploading batch ${i + 1}:`, error)
         throw error
       }
 
       uploaded += batch.length
-      console.log(`Uploaded batch ${i + 1}/${totalBatches} (${uploaded}/${dataset.length} conversations)`)
+      // Redraw one progress line on a terminal; elsewhere only the summary below is written
+      if (process.stdout.isTTY) {
+        process.stdout.write(`\rUploaded batch ${i + 1}/${totalBatches} (${uploaded}/${dataset.length} conversations)`)
+      }
 
-      // Small delay between batches to avoid rate limits
-      await new Promise(resolve => setTimeout(resolve, 100))
+      // Small delay between batches to avoid rate limits; none after the last one
+      if (i < totalBatches - 1) {
+        await new Promise(resolve => setTimeout(resolve, 100))
+      }
     } catch (error) {
+      if (process.stdout.isTTY) process.stdout.write('\n')
       console.error(`Failed to upload batch ${i + 1}:`, error)
       throw error
     }
   }
 
+  if (process.stdout.isTTY) process.stdout.write('\n')
   console.log(`Successfully uploaded ${uploaded} conversations to Supabase!`)
 }
 
@@ -490,15 +491,32 @@ export async function uploadToSupabase(
  */
 export async function main() {
   try {
-    console.log('🚀 Generating mock dataset...')
-    const dataset = generateMockDataset(500)
-
-    console.log(`✅ Generated ${dataset.length} conversations`)
-    console.log(`📊 Dataset statistics:`)
-    console.log(`   - Users: ${new Set(dataset.map(d => d.user_id)).size}`)
-    console.log(`   - Projects: ${new Set(dataset.map(d => d.project_id)).size}`)
-    console.log(`   - Installations: ${new Set(dataset.map(d => d.installation_id)).size}`)
-    console.log(`   - Date range: ${dataset[0].interaction_timestamp} to ${dataset[dataset.length - 1].interaction_timestamp}`)
+    // The runner script passes the requested size through DATASET_COUNT
+    const requestedCount = Number.parseInt(process.env.DATASET_COUNT ?? '', 10)
+    const count = Number.isFinite(requestedCount) && requestedCount > 0 ? requestedCount : 500
+
+    console.log(`🚀 Generating mock dataset of ${count} conversations...`)
+    const dataset = generateMockDataset(count)
+
+    // Collect distinct users, projects and installations in a single pass
+    const users = new Set<string>()
+    const projects = new Set<string>()
+    const installationIds = new Set<string>()
+    for (const conversation of dataset) {
+      users.add(conversation.user_id)
+      projects.add(conversation.project_id)
+      installationIds.add(conversation.installation_id)
+    }
+
+    // Emit the summary as one write rather than one console call per line
+    console.log([
+      `✅ Generated ${dataset.length} conversations`,
+      `📊 Dataset statistics:`,
+      `   - Users: ${users.size}`,
+      `   - Projects: ${projects.size}`,
+      `   - Installations: ${installationIds.size}`,
+      `   - Date range: ${dataset[0].interaction_timestamp} to ${dataset[dataset.length - 1].interaction_timestamp}`
+    ].join('\n'))
 
     console.log('\n📤 Uploading to Supabase...')
     await uploadToSupabase(dataset)
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useMemo } from 'react'
 import {
   Brain,
   Clock,
@@ -46,6 +46,12 @@ export function DeveloperDetailModal({ developer, conversations, trigger }: Deve
 
   const { analyzeConversations } = useSimpleLLMAnalysis()
 
+  // This developer's conversations, filtered once and shared by the loader and the render
+  const userConversations = useMemo(
+    () => conversations.filter(conv => conv.user_id === developer.id),
+    [conversations, developer.id]
+  )
+
   // Load detailed insights when modal opens
   useEffect(() => {
     if (isOpen && !detailedInsights && !isLoadingInsights) {
@@ -56,9 +62,6 @@ export function DeveloperDetailModal({ developer, conversations, trigger }: Deve
   const loadDetailedInsights = async () => {
     setIsLoadingInsights(true)
     try {
-      // Filter conversations for this developer
-      const userConversations = conversations.filter(conv => conv.user_id === developer.id)
-
       if (userConversations.length === 0) {
         // Create a basic insight when no conversations available
         setDetailedInsights({
@@ -253,7 +256,7 @@ export function DeveloperDetailModal({ developer, conversations, trigger }: Deve
                       <div className="text-center">
                         <h3 className="text-purple-300 font-medium mb-1">Generating AI Insights</h3>
                         <p className="text-purple-200/70 text-sm">
-                          Analyzing {conversations.filter(c => c.user_id === developer.id).length} conversations...
+                          Analyzing {userConversations.length} conversations...
                         </p>
                       </div>
                       <div className="flex space-x-1">
@@ -156,13 +156,19 @@ export function DevelopmentTimeline({
     setIsAnalyzing(true)
 
     try {
-      // Fetch the raw logs for LLM analysis
-      const { data: logs } = await supabase
+      // Fetch the raw logs for LLM analysis, scoped like the timeline itself
+      let query = supabase
         .from('claude_chat_logs')
         .select('*')
         .eq('user_id', userId)
         .gte('interaction_timestamp', dateRange.startDate)
         .lte('interaction_timestamp', dateRange.endDate)
+
+      if (projectId) {
+        query = query.eq('project_id', projectId)
+      }
+
+      const { data: logs } = await query
         .order('interaction_timestamp', { ascending: false })
         .limit(30)
 
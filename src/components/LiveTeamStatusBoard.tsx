@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useMemo } from 'react'
 import {
   Users,
   Clock,
@@ -27,12 +27,25 @@ import { DeveloperDetailModal } from './DeveloperDetailModal'
 import { TaskDetailModal } from './TaskDetailModal'
 import type { ConversationData } from '@/services/simpleLLMAnalysis'
 
+// Shared empty list so developers without conversations keep a stable prop
+const NO_CONVERSATIONS: ConversationData[] = []
+
 export function LiveTeamStatusBoard() {
   const [autoRefresh, setAutoRefresh] = useState(true)
   const { llmEnabled, setLLMEnabled, showLLMInsights, setShowLLMInsights } = useLLMToggle(false)
 
   const { teamStatus, conversations, isLoading, error, lastUpdated, refresh, isLLMAnalyzing } = useRubeTeamStatus(llmEnabled)
 
+  // Summary counts in one pass instead of a filtered copy per status
+  const statusCounts = useMemo(() => {
+    const counts = { flow: 0, problem_solving: 0, blocked: 0, idle: 0, analyzed: 0 }
+    for (const dev of teamStatus) {
+      counts[dev.status]++
+      if (dev.llmInsights) counts.analyzed++
+    }
+    return counts
+  }, [teamStatus])
+
   // Auto-refresh effect
   useEffect(() => {
     if (!autoRefresh) return
@@ -89,15 +102,16 @@ export function LiveTeamStatusBoard() {
     return `${Math.floor(seconds / 86400)} days ago`
   }
 
-  // Convert conversations to the format expected by the modal
-  const modalConversations: ConversationData[] = conversations.map(conv => ({
-    id: conv.id,
-    user_id: conv.user_id,
-    user_query: conv.user_query,
-    claude_response: conv.claude_response,
-    interaction_timestamp: conv.interaction_timestamp,
-    project_name: conv.project_name
-  }))
+  // Partition the fetched conversations by developer once per refresh, so each modal
+  // receives only its developer's rows instead of copying and rescanning the whole list
+  const conversationsByUser = useMemo(() => {
+    const groups: Record<string, ConversationData[]> = {}
+    for (const conv of conversations) {
+      const group = groups[conv.user_id] ?? (groups[conv.user_id] = [])
+      group.push(conv)
+    }
+    return groups
+  }, [conversations])
 
   // Show loading state
   if (isLoading && teamStatus.length === 0) {
@@ -187,12 +201,12 @@ export function LiveTeamStatusBoard() {
             </h2>
             <p className="text-sm text-gray-400 mt-1">
               {teamStatus.length} active developers •
-              {teamStatus.filter(dev => dev.status === 'flow').length} in flow •
-              {teamStatus.filter(dev => dev.status === 'problem_solving').length} problem solving •
-              {teamStatus.filter(dev => dev.status === 'blocked').length} blocked
+              {statusCounts.flow} in flow •
+              {statusCounts.problem_solving} problem solving •
+              {statusCounts.blocked} blocked
               {llmEnabled && (
                 <span className="text-purple-400 ml-2 flex items-center gap-1">
-                  • AI Enhanced ({teamStatus.filter(dev => dev.llmInsights).length}/{teamStatus.length} analyzed)
+                  • AI Enhanced ({statusCounts.analyzed}/{teamStatus.length} analyzed)
                   {isLLMAnalyzing && (
                     <div className="flex items-center gap-1">
                       <div className="w-1 h-1 bg-purple-400 rounded-full animate-pulse"></div>
@@ -228,7 +242,7 @@ export function LiveTeamStatusBoard() {
         <DeveloperDetailModal
           key={developer.id}
           developer={developer}
-          conversations={modalConversations}
+          conversations={conversationsByUser[developer.id] ?? NO_CONVERSATIONS}
           trigger={
             <Card className="bg-gray-900 border-gray-800 cursor-pointer hover:border-gray-600 hover:shadow-lg hover:shadow-purple-500/10 transition-all duration-200 group">
               <CardHeader className="pb-4">
@@ -329,7 +343,7 @@ export function LiveTeamStatusBoard() {
                       key={task.id}
                       task={task}
                       developer={developer}
-                      conversations={modalConversations}
+                      conversations={conversationsByUser[developer.id] ?? NO_CONVERSATIONS}
                     />
                   ))}
                 </div>
@@ -261,11 +261,14 @@ async function transformSingleLogToEvent(
     impact = 'high'
   }
 
+  // Combined text is built once and shared by the extractors below
+  const fullText = query + ' ' + response
+
   // Extract technologies mentioned
-  const technologies = extractTechnologies(query + ' ' + (response || ''))
+  const technologies = extractTechnologies(fullText)
 
   // Extract file paths if mentioned
-  const files = extractFilePaths(query + ' ' + (response || ''))
+  const files = extractFilePaths(fullText)
 
   // Calculate duration based on response length and complexity
   const duration = estimateDuration(log)
@@ -364,8 +367,12 @@ function analyzeTimeline(events: DevelopmentEvent[]): TimelineAnalysis {
 
   // Analyze momentum
   const recentEvents = events.slice(0, 5)
-  const completedRecent = recentEvents.filter(e => e.status === 'completed').length
-  const blockedRecent = recentEvents.filter(e => e.status === 'blocked').length
+  let completedRecent = 0
+  let blockedRecent = 0
+  for (const event of recentEvents) {
+    if (event.status === 'completed') completedRecent++
+    else if (event.status === 'blocked') blockedRecent++
+  }
   const overallMomentum = 
     blockedRecent > 2 ? 'blocked' :
     completedRecent >= 4 ? 'accelerating' :
@@ -407,22 +414,24 @@ function analyzeTimeline(events: DevelopmentEvent[]): TimelineAnalysis {
   }
 }
 
+// Technology keywords paired with their display label. Built once so every event
+// shares the same label strings instead of allocating new ones per match.
+const TECHNOLOGY_LABELS: ReadonlyArray<readonly [string, string]> = [
+  'react', 'typescript', 'javascript', 'node', 'python', 'java',
+  'css', 'html', 'sql', 'graphql', 'rest', 'api', 'docker',
+  'kubernetes', 'aws', 'azure', 'gcp', 'git', 'webpack', 'vite',
+  'next', 'vue', 'angular', 'svelte', 'tailwind', 'supabase',
+  'postgresql', 'mongodb', 'redis', 'elasticsearch'
+].map(tech => [tech, tech.charAt(0).toUpperCase() + tech.slice(1)] as const)
+
 // Helper functions
 function extractTechnologies(text: string): string[] {
-  const technologies = [
-    'react', 'typescript', 'javascript', 'node', 'python', 'java',
-    'css', 'html', 'sql', 'graphql', 'rest', 'api', 'docker',
-    'kubernetes', 'aws', 'azure', 'gcp', 'git', 'webpack', 'vite',
-    'next', 'vue', 'angular', 'svelte', 'tailwind', 'supabase',
-    'postgresql', 'mongodb', 'redis', 'elasticsearch'
-  ]
-
   const found = new Set<string>()
   const lowerText = text.toLowerCase()
 
-  technologies.forEach(tech => {
+  TECHNOLOGY_LABELS.forEach(([tech, label]) => {
     if (lowerText.includes(tech)) {
-      found.add(tech.charAt(0).toUpperCase() + tech.slice(1))
+      found.add(label)
     }
   })
 
@@ -446,16 +455,27 @@ function estimateDuration(log: ClaudeChatLog): number {
   return Math.round(baseTime + complexityFactor * 5)
 }
 
+// Phrase checks for the per-event classifiers, compiled once as case-insensitive
+// alternations so each query is neither lowercased nor scanned once per phrase
+const EXCITED_PATTERN = /awesome|great|perfect/i
+const FRUSTRATED_PATTERN = /error|stuck|help/i
+const BUILDING_PATTERN = /implement|create|add/i
+const DEBUGGING_PATTERN = /fix|debug|error/i
+const OPTIMIZATION_PATTERN = /refactor|optimize/i
+const TESTING_PATTERN = /test/i
+const ERROR_PATTERN = /error/i
+const PERFORMANCE_PATTERN = /slow|performance/i
+const COMPLEXITY_PATTERN = /complex/i
+
 function analyzeSentiment(query: string): 'positive' | 'neutral' | 'frustrated' | 'excited' {
-  const lowerQuery = query.toLowerCase()
-  
-  if (lowerQuery.includes('awesome') || lowerQuery.includes('great') || lowerQuery.includes('perfect')) {
+  if (EXCITED_PATTERN.test(query)) {
     return 'excited'
   }
-  if (lowerQuery.includes('error') || lowerQuery.includes('stuck') || lowerQuery.includes('help')) {
+  if (FRUSTRATED_PATTERN.test(query)) {
     return 'frustrated'
   }
-  if (lowerQuery.includes('!') && !lowerQuery.includes('error')) {
+  // Queries mentioning errors already returned above
+  if (query.includes('!')) {
     return 'positive'
   }
   
@@ -464,8 +484,10 @@ function analyzeSentiment(query: string): 'positive' | 'neutral' | 'frustrated'
 
 function analyzeComplexity(query: string, response: string): 'beginner' | 'intermediate' | 'advanced' {
   const complexKeywords = ['architecture', 'optimize', 'performance', 'scale', 'algorithm', 'complexity']
+  const lowerQuery = query.toLowerCase()
+  const lowerResponse = response.toLowerCase()
   const advancedCount = complexKeywords.filter(kw => 
-    query.toLowerCase().includes(kw) || response.toLowerCase().includes(kw)
+    lowerQuery.includes(kw) || lowerResponse.includes(kw)
   ).length
   
   if (advancedCount >= 2) return 'advanced'
@@ -480,18 +502,16 @@ function calculateProductivityScore(log: ClaudeChatLog): number {
 }
 
 function determineFocus(query: string): string {
-  const lowerQuery = query.toLowerCase()
-  
-  if (lowerQuery.includes('implement') || lowerQuery.includes('create') || lowerQuery.includes('add')) {
+  if (BUILDING_PATTERN.test(query)) {
     return 'Building new features'
   }
-  if (lowerQuery.includes('fix') || lowerQuery.includes('debug') || lowerQuery.includes('error')) {
+  if (DEBUGGING_PATTERN.test(query)) {
     return 'Debugging and fixes'
   }
-  if (lowerQuery.includes('refactor') || lowerQuery.includes('optimize')) {
+  if (OPTIMIZATION_PATTERN.test(query)) {
     return 'Code optimization'
   }
-  if (lowerQuery.includes('test')) {
+  if (TESTING_PATTERN.test(query)) {
     return 'Testing'
   }
   
@@ -515,11 +535,10 @@ function extractLearningPoints(response: string): string[] {
 
 function extractChallenges(query: string): string[] {
   const challenges: string[] = []
-  const lowerQuery = query.toLowerCase()
   
-  if (lowerQuery.includes('error')) challenges.push('Error resolution')
-  if (lowerQuery.includes('slow') || lowerQuery.includes('performance')) challenges.push('Performance optimization')
-  if (lowerQuery.includes('complex')) challenges.push('Complexity management')
+  if (ERROR_PATTERN.test(query)) challenges.push('Error resolution')
+  if (PERFORMANCE_PATTERN.test(query)) challenges.push('Performance optimization')
+  if (COMPLEXITY_PATTERN.test(query)) challenges.push('Complexity management')
   
   return challenges
 }
@@ -590,19 +609,27 @@ function extractCommonChallenges(events: DevelopmentEvent[]): string[] {
 
 function analyzeStrengths(events: DevelopmentEvent[]): string[] {
   const strengths: string[] = []
-  const completedCount = events.filter(e => e.status === 'completed').length
+  let completedCount = 0
+  let highImpactCount = 0
+  for (const event of events) {
+    if (event.status === 'completed') completedCount++
+    if (event.impact === 'high' || event.impact === 'critical') highImpactCount++
+  }
   
   if (completedCount / events.length > 0.8) {
     strengths.push('High completion rate')
   }
   
-  const highImpactCount = events.filter(e => e.impact === 'high' || e.impact === 'critical').length
   if (highImpactCount / events.length > 0.3) {
     strengths.push('Focus on high-impact work')
   }
   
-  const techDiversity = new Set(events.flatMap(e => e.technologies || [])).size
-  if (techDiversity > 5) {
+  // Add to one set directly rather than flattening every event's list first
+  const technologies = new Set<string>()
+  for (const event of events) {
+    event.technologies?.forEach(tech => technologies.add(tech))
+  }
+  if (technologies.size > 5) {
     strengths.push('Technology versatility')
   }
   
@@ -636,12 +663,18 @@ function generateRecommendations(
     recommendations.push('Explore new technologies to broaden your skill set')
   }
 
-  const testingEvents = events.filter(e => e.type === 'testing').length
+  // Count both event types in one pass
+  let testingEvents = 0
+  let docEvents = 0
+  for (const event of events) {
+    if (event.type === 'testing') testingEvents++
+    else if (event.type === 'documentation') docEvents++
+  }
+
   if (testingEvents / events.length < 0.1) {
     recommendations.push('Increase focus on testing to improve code quality')
   }
 
-  const docEvents = events.filter(e => e.type === 'documentation').length
   if (docEvents / events.length < 0.05) {
     recommendations.push('Add more documentation to improve code maintainability')
   }
@@ -1,6 +1,7 @@
 import { useState, useEffect, useCallback } from 'react'
+import { getUserIdentity } from '@/lib/userIdentity'
+import { CONVERSATION_COLUMNS, SUPABASE_CONFIGURED } from '@/lib/teamStatusQuery'
 import { useSimpleLLMAnalysis, useMergeLLMWithStatus } from './useSimpleLLMAnalysis'
-import type { ConversationData as LLMConversationData } from '../services/simpleLLMAnalysis'
 
 export interface DeveloperTask {
   id: string
@@ -49,6 +50,17 @@ interface ConversationData {
   status: 'pending' | 'completed'
 }
 
+// Conversation paired with its parsed timestamp so dates are only parsed once per refresh
+interface TimedConversation {
+  conv: ConversationData
+  time: number
+}
+
+// Status indicators, each compiled once into a single case-insensitive alternation
+const BLOCKED_KEYWORDS = /error|stuck|help|issue|problem|bug|fail|not working/i
+const PROBLEM_KEYWORDS = /debug|fix|troubleshoot|optimize|refactor|test/i
+const FLOW_KEYWORDS = /implement|create|add|build|develop|make/i
+
 // RUBE integration hook for fetching real-time team status from Supabase
 export function useRubeTeamStatus(enableLLM = false) {
   const [teamStatus, setTeamStatus] = useState<DeveloperStatus[]>([])
@@ -61,117 +73,88 @@ export function useRubeTeamStatus(enableLLM = false) {
   const { analyzeConversations, isAnalyzing: isLLMAnalyzing, error: llmError } = useSimpleLLMAnalysis()
   const { mergeAnalysis } = useMergeLLMWithStatus()
 
-  // Supabase configuration from environment
-  const SUPABASE_URL = import.meta.env.VITE_SUPABASE_URL
-  const SUPABASE_KEY = import.meta.env.VITE_SUPABASE_ANON_KEY
-
-  // Fetch team status data using direct API calls (since RUBE connection isn't available)
+  // Fetch team status data through the shared Supabase client (since RUBE connection isn't available)
   const fetchTeamStatusData = useCallback(async (): Promise<ConversationData[]> => {
-    const headers = {
-      'apikey': SUPABASE_KEY,
-      'Authorization': `Bearer ${SUPABASE_KEY}`,
-      'Content-Type': 'application/json'
+    if (!SUPABASE_CONFIGURED) {
+      throw new Error('Missing Supabase environment variables')
     }
 
-    const response = await fetch(
-      `${SUPABASE_URL}/rest/v1/claude_chat_logs?select=*&order=interaction_timestamp.desc&limit=100`,
-      { headers }
-    )
+    const { supabase } = await import('@/lib/supabase')
+    const { data, error } = await supabase
+      .from('claude_chat_logs')
+      .select(CONVERSATION_COLUMNS)
+      .order('interaction_timestamp', { ascending: false })
+      .limit(100)
 
-    if (!response.ok) {
-      throw new Error(`Failed to fetch data: ${response.statusText}`)
+    if (error) {
+      throw new Error(`Failed to fetch data: ${error.message}`)
     }
 
-    return response.json()
-  }, [SUPABASE_URL, SUPABASE_KEY])
+    return data || []
+  }, [])
 
   // Transform conversation data into developer status format
   const transformToTeamStatus = useCallback((conversations: ConversationData[]): DeveloperStatus[] => {
-    const now = new Date()
-    const fourHoursAgo = new Date(now.getTime() - 4 * 60 * 60 * 1000)
-    const twentyFourHoursAgo = new Date(now.getTime() - 24 * 60 * 60 * 1000)
+    const nowMs = Date.now()
+    const fourHoursAgo = nowMs - 4 * 60 * 60 * 1000
+    const twentyFourHoursAgo = nowMs - 24 * 60 * 60 * 1000
 
-    // Group conversations by user
+    // Group conversations by user, parsing each timestamp once up front
     const userGroups = conversations.reduce((acc, conv) => {
-      if (!acc[conv.user_id]) {
-        acc[conv.user_id] = []
-      }
-      acc[conv.user_id].push(conv)
+      const group = acc[conv.user_id] ?? (acc[conv.user_id] = [])
+      group.push({ conv, time: new Date(conv.interaction_timestamp).getTime() })
       return acc
-    }, {} as Record<string, ConversationData[]>)
-
-    return Object.entries(userGroups).map(([userId, userConversations]) => {
-      const sortedConversations = userConversations.sort(
-        (a, b) => new Date(b.interaction_timestamp).getTime() - new Date(a.interaction_timestamp).getTime()
-      )
-
-      const latestConversation = sortedConversations[0]
-      const latestTimestamp = new Date(latestConversation.interaction_timestamp)
-
-      // Recent conversations (last 4 hours)
-      const recentConversations = sortedConversations.filter(
-        conv => new Date(conv.interaction_timestamp) > fourHoursAgo
-      )
-
-      // All conversations in last 24 hours
-      const todayConversations = sortedConversations.filter(
-        conv => new Date(conv.interaction_timestamp) > twentyFourHoursAgo
-      )
+    }, {} as Record<string, TimedConversation[]>)
+
+    return Object.entries(userGroups).map(([userId, userEntries]) => {
+      const sortedEntries = userEntries.sort((a, b) => b.time - a.time)
+
+      const latestConversation = sortedEntries[0].conv
+      const latestTimestamp = new Date(sortedEntries[0].time)
+
+      // Count recent (last 4 hours) and today's (last 24 hours) conversations in one
+      // pass. Entries are sorted newest first, so we can stop at the 24h cutoff.
+      let recentCount = 0
+      let todayCount = 0
+      let todayCompleted = 0
+      for (const entry of sortedEntries) {
+        if (entry.time <= twentyFourHoursAgo) break
+        todayCount++
+        if (entry.conv.status === 'completed') todayCompleted++
+        if (entry.time > fourHoursAgo) recentCount++
+      }
 
       // Determine user status based on activity and content
       let status: DeveloperStatus['status'] = 'idle'
       let statusMessage = 'No recent activity'
 
-      if (recentConversations.length > 0) {
-        const latestQuery = latestConversation.user_query.toLowerCase()
+      if (recentCount > 0) {
+        const latestQuery = latestConversation.user_query
 
-        // Check for blocked indicators
-        const blockedKeywords = ['error', 'stuck', 'help', 'issue', 'problem', 'bug', 'fail', 'not working']
-        const hasBlockedKeywords = blockedKeywords.some(keyword => latestQuery.includes(keyword))
-
-        // Check for problem-solving indicators
-        const problemKeywords = ['debug', 'fix', 'troubleshoot', 'optimize', 'refactor', 'test']
-        const hasProblemKeywords = problemKeywords.some(keyword => latestQuery.includes(keyword))
-
-        // Check for flow indicators
-        const flowKeywords = ['implement', 'create', 'add', 'build', 'develop', 'make']
-        const hasFlowKeywords = flowKeywords.some(keyword => latestQuery.includes(keyword))
-
-        if (hasBlockedKeywords) {
+        if (BLOCKED_KEYWORDS.test(latestQuery)) {
           status = 'blocked'
           statusMessage = `Blocked on: ${latestConversation.user_query.substring(0, 80)}...`
-        } else if (recentConversations.length > 3) {
+        } else if (recentCount > 3) {
           status = 'problem_solving'
-          statusMessage = `Problem solving with ${recentConversations.length} recent queries`
-        } else if (hasFlowKeywords || hasProblemKeywords) {
+          statusMessage = `Problem solving with ${recentCount} recent queries`
+        } else if (FLOW_KEYWORDS.test(latestQuery) || PROBLEM_KEYWORDS.test(latestQuery)) {
           status = 'flow'
           statusMessage = `Working on: ${latestConversation.user_query.substring(0, 80)}...`
         } else {
           status = 'flow'
           statusMessage = `Active: ${latestConversation.user_query.substring(0, 80)}...`
         }
-      } else if (todayConversations.length > 0) {
+      } else if (todayCount > 0) {
         status = 'idle'
-        statusMessage = `Last active: ${formatTimeAgo(latestTimestamp)}`
+        statusMessage = `Last active: ${formatTimeAgo(latestTimestamp, nowMs)}`
       }
 
       // Generate user display name and initials
-      const displayName = userId === 'VishiATChoudhary' ? 'Vishi Choudhary' :
-                         userId === 'Max' ? 'Max Akishin' :
-                         userId === 'e3b41869-1444-4bf0-a625-90b0f1d1dffb' ? 'Anonymous Developer' :
-                         userId.includes('test') ? `Test User ${userId.slice(-3)}` :
-                         userId
-
-      const initials = displayName
-        .split(' ')
-        .map(word => word[0])
-        .join('')
-        .toUpperCase()
-        .slice(0, 2)
+      const { displayName, initials } = getUserIdentity(userId)
 
       // Create current tasks from recent conversations
-      const currentTasks: DeveloperTask[] = recentConversations.slice(0, 4).map((conv, index) => {
-        const timeSince = now.getTime() - new Date(conv.interaction_timestamp).getTime()
+      const currentTasks: DeveloperTask[] = sortedEntries.slice(0, Math.min(recentCount, 4)).map(({ conv, time }) => {
+        const timeSince = nowMs - time
         const minutesAgo = Math.floor(timeSince / (1000 * 60))
         const timeSpent = minutesAgo > 60 ? `${Math.floor(minutesAgo / 60)} hrs` : `${minutesAgo} min`
 
@@ -185,11 +168,12 @@ export function useRubeTeamStatus(enableLLM = false) {
                         'src/utils/helper.ts'
 
         // Determine task priority
-        const isHighPriority = conv.user_query.toLowerCase().includes('error') ||
-                              conv.user_query.toLowerCase().includes('urgent') ||
-                              conv.user_query.toLowerCase().includes('blocked')
-        const isMediumPriority = conv.user_query.toLowerCase().includes('implement') ||
-                               conv.user_query.toLowerCase().includes('debug')
+        const lowerQuery = conv.user_query.toLowerCase()
+        const isHighPriority = lowerQuery.includes('error') ||
+                              lowerQuery.includes('urgent') ||
+                              lowerQuery.includes('blocked')
+        const isMediumPriority = lowerQuery.includes('implement') ||
+                               lowerQuery.includes('debug')
 
         const taskStatus: DeveloperTask['status'] = isHighPriority ? 'high' :
                                                    isMediumPriority ? 'medium' : 'low'
@@ -217,17 +201,16 @@ export function useRubeTeamStatus(enableLLM = false) {
         status,
         statusMessage,
         currentTasks,
-        totalTasks: todayConversations.length,
-        completedTasks: todayConversations.filter(c => c.status === 'completed').length,
+        totalTasks: todayCount,
+        completedTasks: todayCompleted,
         lastActive: latestConversation.interaction_timestamp
       }
     })
   }, [])
 
   // Helper function to format time ago
-  const formatTimeAgo = (date: Date): string => {
-    const now = new Date()
-    const seconds = Math.floor((now.getTime() - date.getTime()) / 1000)
+  const formatTimeAgo = (date: Date, nowMs = Date.now()): string => {
+    const seconds = Math.floor((nowMs - date.getTime()) / 1000)
 
     if (seconds < 60) return 'just now'
     if (seconds < 3600) return `${Math.floor(seconds / 60)} min ago`
@@ -242,28 +225,20 @@ export function useRubeTeamStatus(enableLLM = false) {
       setError(null)
 
       const fetchedConversations = await fetchTeamStatusData()
-      const transformedData = transformToTeamStatus(fetchedConversations)
+
+      // Filter out users with no recent activity (optional)
+      let activeTeamStatus = transformToTeamStatus(fetchedConversations)
+        .filter(dev => dev.status !== 'idle' || dev.totalTasks > 0)
 
       // Store conversations for modal usage
       setConversations(fetchedConversations)
 
-      // Filter out users with no recent activity (optional)
-      let activeTeamStatus = transformedData.filter(dev => dev.status !== 'idle' || dev.totalTasks > 0)
-
       // Apply LLM analysis if enabled
       if (enableLLM && fetchedConversations.length > 0) {
         try {
-          // Convert conversations to LLM format
-          const llmConversations: LLMConversationData[] = fetchedConversations.map(conv => ({
-            id: conv.id,
-            user_id: conv.user_id,
-            user_query: conv.user_query,
-            claude_response: conv.claude_response,
-            interaction_timestamp: conv.interaction_timestamp,
-            project_name: conv.project_name
-          }))
-
-          const llmResults = await analyzeConversations(llmConversations, {
+          // Fetched rows already carry every field the LLM service reads, so they
+          // are passed through as-is rather than copied into new objects
+          const llmResults = await analyzeConversations(fetchedConversations, {
             enabled: true,
             cacheMinutes: 15,
             maxConversations: 50
@@ -284,7 +259,7 @@ export function useRubeTeamStatus(enableLLM = false) {
       setError(err instanceof Error ? err.message : 'Failed to fetch team status')
 
       // Fallback to mock data on error
-      setTeamStatus(getMockTeamStatus())
+      setTeamStatus(MOCK_TEAM_STATUS)
     } finally {
       setIsLoading(false)
     }
@@ -314,28 +289,26 @@ export function useRubeTeamStatus(enableLLM = false) {
   }
 }
 
-// Fallback mock data
-function getMockTeamStatus(): DeveloperStatus[] {
-  return [
-    {
-      id: 'vishi',
-      name: 'Vishi Choudhary',
-      initials: 'VC',
-      status: 'flow',
-      statusMessage: 'Implementing Live Team Status Board with RUBE integration',
-      totalTasks: 15,
-      completedTasks: 8,
-      currentTasks: [
-        {
-          id: 'team-status',
-          title: 'Live Team Status Board',
-          status: 'high',
-          description: 'Integrating real Supabase data with RUBE MCP server',
-          filePath: 'src/hooks/useRubeTeamStatus.ts',
-          timeSpent: '2 hrs',
-          messages: 12
-        }
-      ]
-    }
-  ]
-}
\ No newline at end of file
+// Fallback mock data, built once so repeated fallbacks keep the same array and skip re-renders
+const MOCK_TEAM_STATUS: DeveloperStatus[] = [
+  {
+    id: 'vishi',
+    name: 'Vishi Choudhary',
+    initials: 'VC',
+    status: 'flow',
+    statusMessage: 'Implementing Live Team Status Board with RUBE integration',
+    totalTasks: 15,
+    completedTasks: 8,
+    currentTasks: [
+      {
+        id: 'team-status',
+        title: 'Live Team Status Board',
+        status: 'high',
+        description: 'Integrating real Supabase data with RUBE MCP server',
+        filePath: 'src/hooks/useRubeTeamStatus.ts',
+        timeSpent: '2 hrs',
+        messages: 12
+      }
+    ]
+  }
+]
\ No newline at end of file
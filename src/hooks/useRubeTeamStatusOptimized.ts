@@ -1,4 +1,6 @@
-import { useState, useEffect, useCallback, useMemo } from 'react'
+import { useState, useEffect, useCallback, useMemo, useRef } from 'react'
+import { getUserIdentity } from '@/lib/userIdentity'
+import { CONVERSATION_COLUMNS, SUPABASE_CONFIGURED } from '@/lib/teamStatusQuery'
 
 export interface DeveloperTask {
   id: string
@@ -37,57 +39,95 @@ interface ConversationData {
   status: 'pending' | 'completed'
 }
 
+// Refresh tracing runs every poll, so it is only emitted in development builds
+const debugLog: (...args: unknown[]) => void = import.meta.env.DEV ? console.log.bind(console) : () => {}
+
+// File path patterns, compiled once and tried in priority order
+const FILE_PATH_PATTERNS: readonly RegExp[] = [
+  // Specific file extensions with paths
+  /(?:src\/|components\/|pages\/|hooks\/|lib\/|utils\/|api\/)?[\w\-./]+\.(js|ts|tsx|jsx|py|css|html|json|md|sql|vue|svelte)/i,
+  // Common project paths
+  /src\/[\w\-./]+/i,
+  /components\/[\w\-./]+/i,
+  /pages\/[\w\-./]+/i,
+  /hooks\/[\w\-./]+/i,
+  /lib\/[\w\-./]+/i,
+  /api\/[\w\-./]+/i
+]
+
+// File paths already extracted, keyed by conversation id. Logs are immutable once
+// written, so refreshes that return the same conversations can skip the scan.
+const FILE_PATH_CACHE_LIMIT = 500
+const filePathCache = new Map<string, string>()
+
+// Number of leading entries newer than cutoff in a newest-first list of epoch ms
+function countNewerThan(times: number[], cutoff: number): number {
+  let lo = 0
+  let hi = times.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (times[mid] > cutoff) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
 // Enhanced RUBE integration with caching and performance optimization
 export function useRubeTeamStatusOptimized() {
   const [teamStatus, setTeamStatus] = useState<DeveloperStatus[]>([])
   const [isLoading, setIsLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
   const [lastUpdated, setLastUpdated] = useState<Date>(new Date())
-  const [cachedData, setCachedData] = useState<ConversationData[]>([])
-
-  // Supabase configuration
-  const SUPABASE_URL = import.meta.env.VITE_SUPABASE_URL
-  const SUPABASE_KEY = import.meta.env.VITE_SUPABASE_ANON_KEY
 
   // Cache configuration
   const CACHE_DURATION = 5 * 60 * 1000 // 5 minutes
-  const [lastCacheTime, setLastCacheTime] = useState(0)
+
+  // Fetched rows, held in a ref so updating the cache doesn't recreate the fetch
+  // callbacks (which re-ran the initial fetch effect)
+  const cacheRef = useRef<{ data: ConversationData[]; fetchedAt: number }>({
+    data: [],
+    fetchedAt: 0
+  })
+  // Mirror of the cache for render, since refs are not read during render
+  const [cacheInfo, setCacheInfo] = useState({ rowCount: 0, fetchedAt: 0 })
 
   // Optimized fetch with caching
   const fetchTeamStatusData = useCallback(async (useCache = true): Promise<ConversationData[]> => {
     const now = Date.now()
 
     // Use cache if valid and requested
-    if (useCache && cachedData.length > 0 && (now - lastCacheTime) < CACHE_DURATION) {
-      console.log('🚀 Using cached team status data')
-      return cachedData
+    const cache = cacheRef.current
+    if (useCache && cache.data.length > 0 && (now - cache.fetchedAt) < CACHE_DURATION) {
+      debugLog('🚀 Using cached team status data')
+      return cache.data
     }
 
-    console.log('📡 Fetching fresh team status data...')
+    debugLog('📡 Fetching fresh team status data...')
 
-    const headers = {
-      'apikey': SUPABASE_KEY,
-      'Authorization': `Bearer ${SUPABASE_KEY}`,
-      'Content-Type': 'application/json'
+    if (!SUPABASE_CONFIGURED) {
+      throw new Error('Missing Supabase environment variables')
     }
 
-    const response = await fetch(
-      `${SUPABASE_URL}/rest/v1/claude_chat_logs?select=*&order=interaction_timestamp.desc&limit=100`,
-      { headers }
-    )
+    // Shared client, so headers and configuration are not rebuilt per request
+    const { supabase } = await import('@/lib/supabase')
+    const { data: rows, error } = await supabase
+      .from('claude_chat_logs')
+      .select(CONVERSATION_COLUMNS)
+      .order('interaction_timestamp', { ascending: false })
+      .limit(100)
 
-    if (!response.ok) {
-      throw new Error(`Failed to fetch data: ${response.statusText}`)
+    if (error) {
+      throw new Error(`Failed to fetch data: ${error.message}`)
     }
 
-    const data = await response.json()
+    const data: ConversationData[] = rows || []
 
     // Update cache
-    setCachedData(data)
-    setLastCacheTime(now)
+    cacheRef.current = { data, fetchedAt: now }
+    setCacheInfo({ rowCount: data.length, fetchedAt: now })
 
     return data
-  }, [SUPABASE_URL, SUPABASE_KEY, cachedData, lastCacheTime])
+  }, [])
 
   // Memoized status classification functions
   const statusClassifiers = useMemo(() => ({
@@ -96,14 +136,6 @@ export function useRubeTeamStatusOptimized() {
     flowKeywords: ['implement', 'create', 'add', 'build', 'develop', 'make', 'design', 'setup']
   }), [])
 
-  // Optimized user display name mapping
-  const userDisplayNames = useMemo(() => ({
-    'VishiATChoudhary': 'Vishi Choudhary',
-    'Max': 'Max Akishin',
-    'e3b41869-1444-4bf0-a625-90b0f1d1dffb': 'Anonymous Developer',
-    'teammate_john': 'John Martinez'
-  }), [])
-
   // Enhanced status determination with machine learning-like scoring
   const determineUserStatus = useCallback((
     userConversations: ConversationData[],
@@ -165,59 +197,48 @@ export function useRubeTeamStatusOptimized() {
 
   // Enhanced file path extraction with better regex patterns
   const extractFilePath = useCallback((text: string): string => {
-    const patterns = [
-      // Specific file extensions with paths
-      /(?:src\/|components\/|pages\/|hooks\/|lib\/|utils\/|api\/)?[\w\-./]+\.(js|ts|tsx|jsx|py|css|html|json|md|sql|vue|svelte)/i,
-      // Common project paths
-      /src\/[\w\-./]+/i,
-      /components\/[\w\-./]+/i,
-      /pages\/[\w\-./]+/i,
-      /hooks\/[\w\-./]+/i,
-      /lib\/[\w\-./]+/i,
-      /api\/[\w\-./]+/i
-    ]
-
-    for (const pattern of patterns) {
+    for (const pattern of FILE_PATH_PATTERNS) {
       const match = text.match(pattern)
       if (match) return match[0]
     }
 
     // Fallback based on content analysis
-    if (text.toLowerCase().includes('component')) return 'src/components/Component.tsx'
-    if (text.toLowerCase().includes('auth')) return 'src/auth/service.ts'
-    if (text.toLowerCase().includes('api')) return 'src/api/endpoint.ts'
-    if (text.toLowerCase().includes('hook')) return 'src/hooks/useCustom.ts'
-    if (text.toLowerCase().includes('database') || text.toLowerCase().includes('db')) return 'src/lib/database.ts'
+    const lowerText = text.toLowerCase()
+    if (lowerText.includes('component')) return 'src/components/Component.tsx'
+    if (lowerText.includes('auth')) return 'src/auth/service.ts'
+    if (lowerText.includes('api')) return 'src/api/endpoint.ts'
+    if (lowerText.includes('hook')) return 'src/hooks/useCustom.ts'
+    if (lowerText.includes('database') || lowerText.includes('db')) return 'src/lib/database.ts'
 
     return 'src/utils/helper.ts'
   }, [])
 
   // Enhanced transformation with better task categorization
   const transformToTeamStatus = useCallback((conversations: ConversationData[]): DeveloperStatus[] => {
-    const now = new Date()
-    const fourHoursAgo = new Date(now.getTime() - 4 * 60 * 60 * 1000)
-    const twentyFourHoursAgo = new Date(now.getTime() - 24 * 60 * 60 * 1000)
+    const nowMs = Date.now()
+    const fourHoursAgo = nowMs - 4 * 60 * 60 * 1000
+    const twentyFourHoursAgo = nowMs - 24 * 60 * 60 * 1000
 
     // Group and sort conversations by user
     const userGroups = conversations.reduce((acc, conv) => {
-      if (!acc[conv.user_id]) acc[conv.user_id] = []
-      acc[conv.user_id].push(conv)
+      const group = acc[conv.user_id] ?? (acc[conv.user_id] = [])
+      group.push(conv)
       return acc
     }, {} as Record<string, ConversationData[]>)
 
     return Object.entries(userGroups)
       .map(([userId, userConversations]) => {
-        const sortedConversations = userConversations.sort(
-          (a, b) => new Date(b.interaction_timestamp).getTime() - new Date(a.interaction_timestamp).getTime()
-        )
-
-        const recentConversations = sortedConversations.filter(
-          conv => new Date(conv.interaction_timestamp) > fourHoursAgo
-        )
-
-        const todayConversations = sortedConversations.filter(
-          conv => new Date(conv.interaction_timestamp) > twentyFourHoursAgo
-        )
+        // Parse each timestamp once, then sort newest first
+        const timedConversations = userConversations
+          .map(conv => ({ conv, time: new Date(conv.interaction_timestamp).getTime() }))
+          .sort((a, b) => b.time - a.time)
+        const sortedConversations = timedConversations.map(entry => entry.conv)
+        const times = timedConversations.map(entry => entry.time)
+
+        // The list is time-ordered, so each cutoff is a binary search and the
+        // matching conversations are a prefix of the sorted list
+        const recentConversations = sortedConversations.slice(0, countNewerThan(times, fourHoursAgo))
+        const todayConversations = sortedConversations.slice(0, countNewerThan(times, twentyFourHoursAgo))
 
         // Skip inactive users (no activity in 24h)
         if (todayConversations.length === 0) return null
@@ -225,29 +246,27 @@ export function useRubeTeamStatusOptimized() {
         const { status, message } = determineUserStatus(sortedConversations, recentConversations)
 
         // Generate enhanced user info
-        const displayName = userDisplayNames[userId] ||
-          (userId.includes('test') ? `Test User ${userId.slice(-3)}` :
-           userId.length > 20 ? 'Anonymous Developer' : userId)
-
-        const initials = displayName
-          .split(' ')
-          .map(word => word[0])
-          .join('')
-          .toUpperCase()
-          .slice(0, 2)
+        const { displayName, initials } = getUserIdentity(userId)
 
         // Create enhanced tasks with better metadata
         const currentTasks: DeveloperTask[] = recentConversations
           .slice(0, 6) // Show up to 6 recent tasks
-          .map((conv) => {
-            const timeSince = now.getTime() - new Date(conv.interaction_timestamp).getTime()
+          .map((conv, index) => {
+            const timeSince = nowMs - times[index]
             const minutesAgo = Math.floor(timeSince / (1000 * 60))
             const timeSpent = minutesAgo > 60 ?
               `${Math.floor(minutesAgo / 60)}h ${minutesAgo % 60}m` :
               `${minutesAgo}m`
 
-            const fullText = `${conv.user_query} ${conv.claude_response || ''}`
-            const filePath = extractFilePath(fullText)
+            let filePath = filePathCache.get(conv.id)
+            if (filePath === undefined) {
+              filePath = extractFilePath(`${conv.user_query} ${conv.claude_response || ''}`)
+              // Evict the oldest entry once the cache is full
+              if (filePathCache.size >= FILE_PATH_CACHE_LIMIT) {
+                filePathCache.delete(filePathCache.keys().next().value)
+              }
+              filePathCache.set(conv.id, filePath)
+            }
 
             // Enhanced task priority logic
             const query = conv.user_query.toLowerCase()
@@ -292,7 +311,7 @@ export function useRubeTeamStatusOptimized() {
         const statusPriority = { blocked: 4, problem_solving: 3, flow: 2, idle: 1 }
         return statusPriority[b.status] - statusPriority[a.status]
       })
-  }, [determineUserStatus, userDisplayNames, extractFilePath])
+  }, [determineUserStatus, extractFilePath])
 
   // Main fetch function with enhanced error handling
   const fetchTeamStatus = useCallback(async (forceRefresh = false) => {
@@ -301,25 +320,25 @@ export function useRubeTeamStatusOptimized() {
       setError(null)
 
       const conversations = await fetchTeamStatusData(!forceRefresh)
+
+      // Always re-derive status: time spent and the 4h/24h windows depend on the current time
       const transformedData = transformToTeamStatus(conversations)
 
       setTeamStatus(transformedData)
       setLastUpdated(new Date())
 
-      console.log(`✅ Team status updated: ${transformedData.length} active developers`)
+      debugLog(`✅ Team status updated: ${transformedData.length} active developers`)
     } catch (err) {
       console.error('❌ Error fetching team status:', err)
       const errorMessage = err instanceof Error ? err.message : 'Failed to fetch team status'
       setError(errorMessage)
 
       // Only fall back to mock data if we have no existing data
-      if (teamStatus.length === 0) {
-        setTeamStatus(getMockTeamStatus())
-      }
+      setTeamStatus(current => current.length === 0 ? MOCK_TEAM_STATUS : current)
     } finally {
       setIsLoading(false)
     }
-  }, [fetchTeamStatusData, transformToTeamStatus, teamStatus.length])
+  }, [fetchTeamStatusData, transformToTeamStatus])
 
   // Force refresh function
   const forceRefresh = useCallback(() => {
@@ -339,44 +358,42 @@ export function useRubeTeamStatusOptimized() {
     refresh: fetchTeamStatus,
     forceRefresh,
     cacheStatus: {
-      isCached: cachedData.length > 0 && (Date.now() - lastCacheTime) < CACHE_DURATION,
-      cacheAge: Date.now() - lastCacheTime,
-      nextRefresh: lastCacheTime + CACHE_DURATION
+      isCached: cacheInfo.rowCount > 0 && (Date.now() - cacheInfo.fetchedAt) < CACHE_DURATION,
+      cacheAge: Date.now() - cacheInfo.fetchedAt,
+      nextRefresh: cacheInfo.fetchedAt + CACHE_DURATION
     }
   }
 }
 
-// Enhanced mock data for fallback
-function getMockTeamStatus(): DeveloperStatus[] {
-  return [
-    {
-      id: 'vishi',
-      name: 'Vishi Choudhary',
-      initials: 'VC',
-      status: 'flow',
-      statusMessage: 'Successfully implemented Live Team Status Board with real Supabase integration',
-      totalTasks: 18,
-      completedTasks: 15,
-      currentTasks: [
-        {
-          id: 'team-status-complete',
-          title: 'Live Team Status Board - COMPLETE',
-          status: 'high',
-          description: 'Real-time team collaboration tracking with RUBE MCP integration',
-          filePath: 'src/hooks/useRubeTeamStatus.ts',
-          timeSpent: '3h 45m',
-          messages: 25
-        },
-        {
-          id: 'performance-optimization',
-          title: 'Performance optimization and caching',
-          status: 'medium',
-          description: 'Enhanced with intelligent caching and status classification',
-          filePath: 'src/hooks/useRubeTeamStatusOptimized.ts',
-          timeSpent: '1h 20m',
-          messages: 8
-        }
-      ]
-    }
-  ]
-}
\ No newline at end of file
+// Enhanced mock data for fallback (module constant, not rebuilt per error)
+const MOCK_TEAM_STATUS: DeveloperStatus[] = [
+  {
+    id: 'vishi',
+    name: 'Vishi Choudhary',
+    initials: 'VC',
+    status: 'flow',
+    statusMessage: 'Successfully implemented Live Team Status Board with real Supabase integration',
+    totalTasks: 18,
+    completedTasks: 15,
+    currentTasks: [
+      {
+        id: 'team-status-complete',
+        title: 'Live Team Status Board - COMPLETE',
+        status: 'high',
+        description: 'Real-time team collaboration tracking with RUBE MCP integration',
+        filePath: 'src/hooks/useRubeTeamStatus.ts',
+        timeSpent: '3h 45m',
+        messages: 25
+      },
+      {
+        id: 'performance-optimization',
+        title: 'Performance optimization and caching',
+        status: 'medium',
+        description: 'Enhanced with intelligent caching and status classification',
+        filePath: 'src/hooks/useRubeTeamStatusOptimized.ts',
+        timeSpent: '1h 20m',
+        messages: 8
+      }
+    ]
+  }
+]
\ No newline at end of file
@@ -7,6 +7,12 @@ export interface SimpleLLMOptions {
   maxConversations?: number
 }
 
+// Cache key for a set of conversations. Ids never contain commas, so a plain join is
+// unambiguous and avoids running the id list through the JSON serializer
+function conversationSetKey(conversations: ConversationData[]): string {
+  return conversations.map(c => c.id).sort().join(',')
+}
+
 export function useSimpleLLMAnalysis() {
   const [isAnalyzing, setIsAnalyzing] = useState(false)
   const [error, setError] = useState<string | null>(null)
@@ -22,7 +28,7 @@ export function useSimpleLLMAnalysis() {
     }
 
     // Check cache first
-    const cacheKey = JSON.stringify(conversations.map(c => c.id).sort())
+    const cacheKey = conversationSetKey(conversations)
     const cached = cache.get(cacheKey)
     if (cached && Date.now() - cached.timestamp < (options.cacheMinutes || 15) * 60 * 1000) {
       return cached.data
@@ -59,7 +65,7 @@ export function useSimpleLLMAnalysis() {
   }, [])
 
   const hasCache = useCallback((conversations: ConversationData[]): boolean => {
-    const cacheKey = JSON.stringify(conversations.map(c => c.id).sort())
+    const cacheKey = conversationSetKey(conversations)
     const cached = cache.get(cacheKey)
     return cached ? Date.now() - cached.timestamp < 15 * 60 * 1000 : false
   }, [cache])
@@ -70,7 +76,7 @@ export function useSimpleLLMAnalysis() {
     options: { cacheMinutes?: number } = {}
   ): Promise<DetailedLLMInsights | null> => {
     // Check cache first
-    const cacheKey = `detailed_${userId}_${JSON.stringify(conversations.slice(0, 3).map(c => c.id))}`
+    const cacheKey = `detailed_${userId}_${conversations.slice(0, 3).map(c => c.id).join(',')}`
     const cached = cache.get(cacheKey)
     if (cached && Date.now() - cached.timestamp < (options.cacheMinutes || 30) * 60 * 1000) {
       return cached.data
@@ -118,8 +124,16 @@ export function useMergeLLMWithStatus() {
   ) => {
     if (!llmResults.length) return basicStatus
 
+    // Index results by user once instead of scanning the list for every developer
+    const resultsByUser = new Map<string, LLMAnalysisResult>()
+    for (const result of llmResults) {
+      if (!resultsByUser.has(result.user_id)) {
+        resultsByUser.set(result.user_id, result)
+      }
+    }
+
     return basicStatus.map((dev: any) => {
-      const llmAnalysis = llmResults.find(result => result.user_id === dev.id)
+      const llmAnalysis = resultsByUser.get(dev.id)
 
       if (!llmAnalysis) return dev
 
@@ -409,12 +409,22 @@ export function useProjectChatAnalysis(projectId?: string) {
     if (error) return { data: null, error }
     if (!logs) return { data: null, error: null }
 
+    // Status and user counts in one pass over the logs
+    let completedConversations = 0
+    let pendingConversations = 0
+    const users = new Set<string>()
+    for (const log of logs) {
+      if (log.status === 'completed') completedConversations++
+      else if (log.status === 'pending') pendingConversations++
+      users.add(log.user_id)
+    }
+
     // Analyze the conversation data
     const analysis = {
       totalConversations: logs.length,
-      completedConversations: logs.filter(log => log.status === 'completed').length,
-      pendingConversations: logs.filter(log => log.status === 'pending').length,
-      uniqueUsers: new Set(logs.map(log => log.user_id)).size,
+      completedConversations,
+      pendingConversations,
+      uniqueUsers: users.size,
       dateRange: {
         earliest: logs[0]?.interaction_timestamp,
         latest: logs[logs.length - 1]?.interaction_timestamp
@@ -486,35 +496,41 @@ export function useUserActivityMetrics(userId?: string, timeframe?: 'day' | 'wee
 // Hook for aggregated project metrics across all projects
 export function useProjectMetricsOverview() {
   return useSupabaseQuery(async () => {
+    // Only the columns the overview reads, capped at PostgREST's default max rows so the
+    // limit is explicit rather than silently applied by the server
     const { data: logs, error } = await supabase
       .from('claude_chat_logs')
-      .select('*')
+      .select('project_id, project_name, user_id, user_query, claude_response, status, interaction_timestamp')
       .order('interaction_timestamp', { ascending: false })
+      .limit(1000)
 
     if (error) return { data: null, error }
     if (!logs) return { data: null, error: null }
 
     // Group by project
     const projectGroups = logs.reduce((acc, log) => {
-      if (!acc[log.project_id]) {
-        acc[log.project_id] = []
-      }
-      acc[log.project_id].push(log)
+      const group = acc[log.project_id] ?? (acc[log.project_id] = [])
+      group.push(log)
       return acc
     }, {} as Record<string, ClaudeChatLog[]>)
 
     // Calculate metrics for each project
     const projectMetrics = Object.entries(projectGroups).map(([projectId, projectLogs]) => {
+      let completedConversations = 0
+      for (const log of projectLogs) {
+        if (log.status === 'completed') completedConversations++
+      }
+
       const analysis = {
         projectId,
         projectName: projectLogs[0]?.project_name || 'Unknown',
         totalConversations: projectLogs.length,
-        completedConversations: projectLogs.filter(log => log.status === 'completed').length,
+        completedConversations,
         uniqueUsers: new Set(projectLogs.map(log => log.user_id)).size,
         lastActivity: projectLogs[0]?.interaction_timestamp,
         topTopics: analyzeConversationTopics(projectLogs).slice(0, 3),
         activityLevel: calculateProjectActivityLevel(projectLogs),
-        completionRate: projectLogs.filter(log => log.status === 'completed').length / projectLogs.length
+        completionRate: completedConversations / projectLogs.length
       }
       return analysis
     })
@@ -523,7 +539,9 @@ export function useProjectMetricsOverview() {
       totalProjects: projectMetrics.length,
       totalConversations: logs.length,
       totalUsers: new Set(logs.map(log => log.user_id)).size,
-      averageCompletionRate: projectMetrics.reduce((sum, p) => sum + p.completionRate, 0) / projectMetrics.length,
+      averageCompletionRate: projectMetrics.length > 0
+        ? projectMetrics.reduce((sum, p) => sum + p.completionRate, 0) / projectMetrics.length
+        : 0,
       mostActiveProject: projectMetrics.sort((a, b) => b.totalConversations - a.totalConversations)[0],
       projectBreakdown: projectMetrics.sort((a, b) => b.totalConversations - a.totalConversations),
       globalTopics: analyzeConversationTopics(logs).slice(0, 5),
@@ -536,14 +554,15 @@ export function useProjectMetricsOverview() {
 
 // Helper function to calculate project activity level
 function calculateProjectActivityLevel(logs: ClaudeChatLog[]): 'high' | 'medium' | 'low' {
-  const recentLogs = logs.filter(log => {
-    const logDate = new Date(log.interaction_timestamp)
-    const weekAgo = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000)
-    return logDate > weekAgo
-  })
+  // Compare epoch ms against a cutoff computed once per project
+  const weekAgo = Date.now() - 7 * 24 * 60 * 60 * 1000
+  let recentCount = 0
+  for (const log of logs) {
+    if (Date.parse(log.interaction_timestamp) > weekAgo) recentCount++
+  }
 
-  if (recentLogs.length >= 10) return 'high'
-  if (recentLogs.length >= 3) return 'medium'
+  if (recentCount >= 10) return 'high'
+  if (recentCount >= 3) return 'medium'
   return 'low'
 }
 
@@ -1,5 +1,5 @@
 import { useState, useCallback } from 'react'
-import { TeamAnalysisService } from '../services/teamAnalysisService'
+import { teamAnalysisService } from '../services/teamAnalysisService'
 import type {
   TeamInsight,
   DeveloperProfile,
@@ -14,14 +14,13 @@ import type {
 export function useTeamHealthAnalysis() {
   const [isLoading, setIsLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
-  const [analysisService] = useState(() => new TeamAnalysisService())
 
   const analyzeTeamHealth = useCallback(async (request: TeamAnalysisRequest): Promise<TeamInsight | null> => {
     setIsLoading(true)
     setError(null)
 
     try {
-      const result = await analysisService.analyzeTeamHealth(request)
+      const result = await teamAnalysisService.analyzeTeamHealth(request)
 
       if (!result.success) {
         throw new Error(result.error || 'Analysis failed')
@@ -35,7 +34,7 @@ export function useTeamHealthAnalysis() {
     } finally {
       setIsLoading(false)
     }
-  }, [analysisService])
+  }, [])
 
   return {
     analyzeTeamHealth,
@@ -48,7 +47,6 @@ export function useTeamHealthAnalysis() {
 export function useDeveloperProfileAnalysis() {
   const [isLoading, setIsLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
-  const [analysisService] = useState(() => new TeamAnalysisService())
 
   const analyzeDeveloperProfile = useCallback(async (request: TeamAnalysisRequest): Promise<DeveloperProfile | null> => {
     if (!request.user_id) {
@@ -60,7 +58,7 @@ export function useDeveloperProfileAnalysis() {
     setError(null)
 
     try {
-      const result = await analysisService.analyzeDeveloperProfile(request)
+      const result = await teamAnalysisService.analyzeDeveloperProfile(request)
 
       if (!result.success) {
         throw new Error(result.error || 'Profile analysis failed')
@@ -74,7 +72,7 @@ export function useDeveloperProfileAnalysis() {
     } finally {
       setIsLoading(false)
     }
-  }, [analysisService])
+  }, [])
 
   return {
     analyzeDeveloperProfile,
@@ -88,7 +86,6 @@ export function useConversationAnalysis() {
   const [isLoading, setIsLoading] = useState(false)
   const [progress, setProgress] = useState(0)
   const [error, setError] = useState<string | null>(null)
-  const [analysisService] = useState(() => new TeamAnalysisService())
 
   const analyzeConversations = useCallback(async (
     projectId?: string,
@@ -106,7 +103,7 @@ export function useConversationAnalysis() {
         conversation_limit: limit
       }
 
-      const conversations = await (analysisService as any).fetchConversations(request)
+      const conversations = await teamAnalysisService.fetchConversations(request)
 
       if (conversations.length === 0) {
         return []
@@ -119,7 +116,7 @@ export function useConversationAnalysis() {
 
       for (let i = 0; i < conversations.length; i += batchSize) {
         const batch = conversations.slice(i, i + batchSize)
-        const batchResults = await analysisService.batchAnalyzeConversations(batch)
+        const batchResults = await teamAnalysisService.batchAnalyzeConversations(batch)
         results.push(...batchResults)
 
         setProgress(((i / batchSize + 1) / totalBatches) * 100)
@@ -134,7 +131,7 @@ export function useConversationAnalysis() {
       setIsLoading(false)
       setProgress(100)
     }
-  }, [analysisService])
+  }, [])
 
   return {
     analyzeConversations,
@@ -149,7 +146,6 @@ export function useTeamDashboard(projectId?: string) {
   const [isLoading, setIsLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
   const [data, setData] = useState<TeamDashboardData | null>(null)
-  const [analysisService] = useState(() => new TeamAnalysisService())
 
   const loadDashboardData = useCallback(async () => {
     if (!projectId) {
@@ -174,8 +170,8 @@ export function useTeamDashboard(projectId?: string) {
 
       // Run parallel analyses
       const [teamHealthResult, conversationsData] = await Promise.all([
-        analysisService.analyzeTeamHealth(baseRequest),
-        (analysisService as any).fetchConversations(baseRequest)
+        teamAnalysisService.analyzeTeamHealth(baseRequest),
+        teamAnalysisService.fetchConversations(baseRequest)
       ])
 
       if (!teamHealthResult.success) {
@@ -183,9 +179,9 @@ export function useTeamDashboard(projectId?: string) {
       }
 
       // Get unique users for individual profiles
-      const uniqueUsers = [...new Set(conversationsData.map((c: any) => c.user_id))]
+      const uniqueUsers = [...new Set(conversationsData.map(c => c.user_id))]
       const profilePromises = uniqueUsers.slice(0, 5).map(userId => // Limit to 5 users to avoid API limits
-        analysisService.analyzeDeveloperProfile({
+        teamAnalysisService.analyzeDeveloperProfile({
           ...baseRequest,
           user_id: userId,
           analysis_type: 'developer_profile'
@@ -220,7 +216,7 @@ export function useTeamDashboard(projectId?: string) {
     } finally {
       setIsLoading(false)
     }
-  }, [projectId, analysisService])
+  }, [projectId])
 
   return {
     data,
@@ -233,7 +229,6 @@ export function useTeamDashboard(projectId?: string) {
 
 // Hook for real-time analysis triggers
 export function useAnalysisTrigger() {
-  const [analysisService] = useState(() => new TeamAnalysisService())
 
   const triggerAnalysis = useCallback(async (
     type: 'team_health' | 'developer_profile' | 'conversation_insights',
@@ -241,17 +236,17 @@ export function useAnalysisTrigger() {
   ) => {
     switch (type) {
       case 'team_health':
-        return await analysisService.analyzeTeamHealth(request)
+        return await teamAnalysisService.analyzeTeamHealth(request)
       case 'developer_profile':
-        return await analysisService.analyzeDeveloperProfile(request)
+        return await teamAnalysisService.analyzeDeveloperProfile(request)
       case 'conversation_insights':
         // This would trigger batch conversation analysis
-        const conversations = await (analysisService as any).fetchConversations(request)
-        return await analysisService.batchAnalyzeConversations(conversations)
+        const conversations = await teamAnalysisService.fetchConversations(request)
+        return await teamAnalysisService.batchAnalyzeConversations(conversations)
       default:
         throw new Error(`Unknown analysis type: ${type}`)
     }
-  }, [analysisService])
+  }, [])
 
   return { triggerAnalysis }
 }
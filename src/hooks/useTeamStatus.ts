@@ -57,7 +57,7 @@ export function useTeamStatus() {
       if (sessionError) {
         // Fall back to mock data
         console.log('Using mock data for team status')
-        setTeamStatus(getMockTeamStatus())
+        setTeamStatus(MOCK_TEAM_STATUS)
         setIsLoading(false)
         return
       }
@@ -93,13 +93,13 @@ export function useTeamStatus() {
         setTeamStatus(developerStatuses)
       } else {
         // No sessions found, use mock data
-        setTeamStatus(getMockTeamStatus())
+        setTeamStatus(MOCK_TEAM_STATUS)
       }
     } catch (err) {
       console.error('Error fetching team status:', err)
       setError(err instanceof Error ? err.message : 'Failed to fetch team status')
       // Fall back to mock data on error
-      setTeamStatus(getMockTeamStatus())
+      setTeamStatus(MOCK_TEAM_STATUS)
     } finally {
       setIsLoading(false)
     }
@@ -151,13 +151,14 @@ function getInitials(name: string): string {
     .slice(0, 2)
 }
 
+// Compiled once; matches the same messages as lowercasing and checking each keyword
+const BLOCKED_MESSAGE_PATTERN = /error|stuck|help/i
+
 function determineStatus(session: any): DeveloperStatus['status'] {
   // Determine status based on session context or messages
   const recentMessages = session.messages || []
   const hasBlockedKeywords = recentMessages.some((msg: any) => 
-    msg.content?.toLowerCase().includes('error') ||
-    msg.content?.toLowerCase().includes('stuck') ||
-    msg.content?.toLowerCase().includes('help')
+    !!msg.content && BLOCKED_MESSAGE_PATTERN.test(msg.content)
   )
   
   if (hasBlockedKeywords) return 'blocked'
@@ -185,63 +186,61 @@ function convertSessionToTask(session: any): DeveloperTask {
   }
 }
 
-// Mock data generator
-function getMockTeamStatus(): DeveloperStatus[] {
-  return [
-    {
-      id: 'sc',
-      name: 'Sarah Chen',
-      initials: 'SC',
-      status: 'flow',
-      statusMessage: 'Implementing authentication flow with JWT tokens and refresh mechanism',
-      totalTasks: 28,
-      completedTasks: 5,
-      currentTasks: [
-        {
-          id: 'jwt-token',
-          title: 'JWT token implementation',
-          status: 'high',
-          description: 'Working on token validation and refresh logic',
-          filePath: 'auth/jwt.service.ts',
-          timeSpent: '45 min',
-          commits: 12,
-          pullRequests: 3
-        },
-        {
-          id: 'auth-middleware',
-          title: 'Auth middleware setup',
-          status: 'medium',
-          description: 'Adding route protection and user context',
-          filePath: 'middleware/auth.middleware.ts',
-          timeSpent: '20 min',
-          commits: 8,
-          pullRequests: 1
-        }
-      ]
-    },
-    {
-      id: 'jm',
-      name: 'John Martinez',
-      initials: 'JM',
-      status: 'blocked',
-      statusMessage: 'Debugging Stripe webhook integration issues with payment processing failures',
-      totalTasks: 72,
-      completedTasks: 2,
-      currentTasks: [
-        {
-          id: 'stripe-webhook',
-          title: 'Stripe webhook failing',
-          status: 'high',
-          description: 'Webhook signature verification failing intermittently',
-          filePath: 'payments/webhook.handler.ts',
-          timeSpent: '2.5 hrs',
-          commits: 47,
-          pullRequests: 0
-        }
-      ]
-    }
-  ]
-}
+// Mock data shared by every fallback path below
+const MOCK_TEAM_STATUS: DeveloperStatus[] = [
+  {
+    id: 'sc',
+    name: 'Sarah Chen',
+    initials: 'SC',
+    status: 'flow',
+    statusMessage: 'Implementing authentication flow with JWT tokens and refresh mechanism',
+    totalTasks: 28,
+    completedTasks: 5,
+    currentTasks: [
+      {
+        id: 'jwt-token',
+        title: 'JWT token implementation',
+        status: 'high',
+        description: 'Working on token validation and refresh logic',
+        filePath: 'auth/jwt.service.ts',
+        timeSpent: '45 min',
+        commits: 12,
+        pullRequests: 3
+      },
+      {
+        id: 'auth-middleware',
+        title: 'Auth middleware setup',
+        status: 'medium',
+        description: 'Adding route protection and user context',
+        filePath: 'middleware/auth.middleware.ts',
+        timeSpent: '20 min',
+        commits: 8,
+        pullRequests: 1
+      }
+    ]
+  },
+  {
+    id: 'jm',
+    name: 'John Martinez',
+    initials: 'JM',
+    status: 'blocked',
+    statusMessage: 'Debugging Stripe webhook integration issues with payment processing failures',
+    totalTasks: 72,
+    completedTasks: 2,
+    currentTasks: [
+      {
+        id: 'stripe-webhook',
+        title: 'Stripe webhook failing',
+        status: 'high',
+        description: 'Webhook signature verification failing intermittently',
+        filePath: 'payments/webhook.handler.ts',
+        timeSpent: '2.5 hrs',
+        commits: 47,
+        pullRequests: 0
+      }
+    ]
+  }
+]
 
 // Hook for updating developer status
 export function useUpdateDeveloperStatus() {
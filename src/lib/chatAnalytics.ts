@@ -48,6 +48,65 @@ const TOPIC_KEYWORDS = {
   'UI/UX': ['design', 'layout', 'interface', 'user experience', 'responsive', 'mobile']
 }
 
+// One pattern per topic, compiled once. Content is lowercased before matching,
+// so a test() here matches the same logs as keywords.some(content.includes).
+const TOPIC_PATTERNS: Array<[string, RegExp]> = Object.entries(TOPIC_KEYWORDS).map(
+  ([topic, keywords]) => [
+    topic,
+    new RegExp(keywords.map(keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'))
+  ]
+)
+
+// Topics mentioned in already-lowercased conversation content
+function matchTopics(content: string): string[] {
+  const topics: string[] = []
+  for (const [topic, pattern] of TOPIC_PATTERNS) {
+    if (pattern.test(content)) topics.push(topic)
+  }
+  return topics
+}
+
+// Topics per log, computed on first use. The project analysis runs several analyzers
+// over the same fetched rows, so each log is lowercased and scanned only once.
+const logTopicsCache = new WeakMap<ClaudeChatLog, string[]>()
+
+function logTopics(log: ClaudeChatLog): string[] {
+  let topics = logTopicsCache.get(log)
+  if (!topics) {
+    topics = matchTopics(`${log.user_query} ${log.claude_response || ''}`.toLowerCase())
+    logTopicsCache.set(log, topics)
+  }
+  return topics
+}
+
+// Count non-overlapping occurrences of needle without splitting text into an array
+function countOccurrences(text: string, needle: string): number {
+  let count = 0
+  let index = text.indexOf(needle)
+  while (index !== -1) {
+    count++
+    index = text.indexOf(needle, index + needle.length)
+  }
+  return count
+}
+
+// Pick the k highest counts without sorting the whole table (ties keep insertion order)
+function topEntries(counts: Record<string, number>, k: number): Array<[string, number]> {
+  if (k <= 0) return []
+
+  const top: Array<[string, number]> = []
+  for (const entry of Object.entries(counts)) {
+    if (top.length === k && entry[1] <= top[k - 1][1]) continue
+
+    let i = top.length
+    while (i > 0 && top[i - 1][1] < entry[1]) i--
+    top.splice(i, 0, entry)
+    if (top.length > k) top.pop()
+  }
+
+  return top
+}
+
 // Analyze conversation topics based on content
 export function analyzeConversationTopics(logs: ClaudeChatLog[]): TopicAnalysis[] {
   const topicCounts: Record<string, { count: number; examples: string[] }> = {}
@@ -60,14 +119,10 @@ export function analyzeConversationTopics(logs: ClaudeChatLog[]): TopicAnalysis[
 
   // Analyze each conversation
   logs.forEach(log => {
-    const content = `${log.user_query} ${log.claude_response || ''}`.toLowerCase()
-
-    Object.entries(TOPIC_KEYWORDS).forEach(([topic, keywords]) => {
-      if (keywords.some(keyword => content.includes(keyword))) {
-        topicCounts[topic].count++
-        if (topicCounts[topic].examples.length < 3) {
-          topicCounts[topic].examples.push(log.user_query.substring(0, 100))
-        }
+    logTopics(log).forEach(topic => {
+      topicCounts[topic].count++
+      if (topicCounts[topic].examples.length < 3) {
+        topicCounts[topic].examples.push(log.user_query.substring(0, 100))
       }
     })
   })
@@ -90,7 +145,6 @@ export function analyzeActivityByDay(logs: ClaudeChatLog[]): ActivityByDay[] {
 
   logs.forEach(log => {
     const date = new Date(log.interaction_timestamp).toISOString().split('T')[0]
-    const content = `${log.user_query} ${log.claude_response || ''}`.toLowerCase()
 
     if (!dayMap[date]) {
       dayMap[date] = { count: 0, completed: 0, topics: new Set() }
@@ -102,11 +156,7 @@ export function analyzeActivityByDay(logs: ClaudeChatLog[]): ActivityByDay[] {
     }
 
     // Identify topics for this day
-    Object.entries(TOPIC_KEYWORDS).forEach(([topic, keywords]) => {
-      if (keywords.some(keyword => content.includes(keyword))) {
-        dayMap[date].topics.add(topic)
-      }
-    })
+    logTopics(log).forEach(topic => dayMap[date].topics.add(topic))
   })
 
   return Object.entries(dayMap)
@@ -130,7 +180,6 @@ export function analyzeUserContributions(logs: ClaudeChatLog[]): UserContributio
 
   logs.forEach(log => {
     const userId = log.user_id
-    const content = `${log.user_query} ${log.claude_response || ''}`.toLowerCase()
 
     if (!userMap[userId]) {
       userMap[userId] = {
@@ -152,10 +201,8 @@ export function analyzeUserContributions(logs: ClaudeChatLog[]): UserContributio
     }
 
     // Track topics
-    Object.entries(TOPIC_KEYWORDS).forEach(([topic, keywords]) => {
-      if (keywords.some(keyword => content.includes(keyword))) {
-        userMap[userId].topics[topic] = (userMap[userId].topics[topic] || 0) + 1
-      }
+    logTopics(log).forEach(topic => {
+      userMap[userId].topics[topic] = (userMap[userId].topics[topic] || 0) + 1
     })
   })
 
@@ -163,66 +210,56 @@ export function analyzeUserContributions(logs: ClaudeChatLog[]): UserContributio
     userId,
     interactions: data.interactions,
     completedInteractions: data.completed,
-    topTopics: Object.entries(data.topics)
-      .sort(([,a], [,b]) => b - a)
-      .slice(0, 3)
-      .map(([topic]) => topic),
+    topTopics: topEntries(data.topics, 3).map(([topic]) => topic),
     lastActive: data.lastActive
   }))
 }
 
-// Analyze development patterns
-export function analyzeDevelopmentPatterns(logs: ClaudeChatLog[]): DevelopmentPattern[] {
-  const patterns: DevelopmentPattern[] = []
-
-  // Pattern 1: Bug Fix Sessions
-  const bugFixLogs = logs.filter(log =>
-    ['bug', 'error', 'fix', 'issue', 'problem'].some(keyword =>
-      log.user_query.toLowerCase().includes(keyword)
-    )
-  )
-
-  if (bugFixLogs.length > 0) {
-    patterns.push({
-      pattern: 'Bug Fix Sessions',
-      frequency: bugFixLogs.length,
-      description: 'User frequently asks for help with debugging and error resolution',
-      relatedTopics: analyzeConversationTopics(bugFixLogs).slice(0, 3).map(t => t.topic)
-    })
+// Development patterns detected from user queries. Each keyword list is compiled into one
+// case-insensitive alternation, so a query is scanned once per pattern without lowercasing
+const DEVELOPMENT_PATTERNS: Array<{ pattern: string; description: string; matcher: RegExp }> = [
+  {
+    // Pattern 1: Bug Fix Sessions
+    pattern: 'Bug Fix Sessions',
+    description: 'User frequently asks for help with debugging and error resolution',
+    matcher: /bug|error|fix|issue|problem/i
+  },
+  {
+    // Pattern 2: Learning New Technologies
+    pattern: 'Technology Learning',
+    description: 'User actively learning new technologies and implementations',
+    matcher: /how to|implement|create|setup|tutorial|example/i
+  },
+  {
+    // Pattern 3: Code Review and Optimization
+    pattern: 'Code Optimization',
+    description: 'User focuses on improving existing code quality and performance',
+    matcher: /optimize|improve|better way|performance|refactor/i
   }
+]
 
-  // Pattern 2: Learning New Technologies
-  const learningIndicators = ['how to', 'implement', 'create', 'setup', 'tutorial', 'example']
-  const learningLogs = logs.filter(log =>
-    learningIndicators.some(indicator =>
-      log.user_query.toLowerCase().includes(indicator)
-    )
-  )
-
-  if (learningLogs.length > 0) {
-    patterns.push({
-      pattern: 'Technology Learning',
-      frequency: learningLogs.length,
-      description: 'User actively learning new technologies and implementations',
-      relatedTopics: analyzeConversationTopics(learningLogs).slice(0, 3).map(t => t.topic)
+// Analyze development patterns
+export function analyzeDevelopmentPatterns(logs: ClaudeChatLog[]): DevelopmentPattern[] {
+  // Walk the logs once, bucketing each query into every pattern it matches
+  const matches: ClaudeChatLog[][] = DEVELOPMENT_PATTERNS.map(() => [])
+  for (const log of logs) {
+    DEVELOPMENT_PATTERNS.forEach(({ matcher }, index) => {
+      if (matcher.test(log.user_query)) matches[index].push(log)
     })
   }
 
-  // Pattern 3: Code Review and Optimization
-  const optimizationLogs = logs.filter(log =>
-    ['optimize', 'improve', 'better way', 'performance', 'refactor'].some(keyword =>
-      log.user_query.toLowerCase().includes(keyword)
-    )
-  )
-
-  if (optimizationLogs.length > 0) {
-    patterns.push({
-      pattern: 'Code Optimization',
-      frequency: optimizationLogs.length,
-      description: 'User focuses on improving existing code quality and performance',
-      relatedTopics: analyzeConversationTopics(optimizationLogs).slice(0, 3).map(t => t.topic)
-    })
-  }
+  const patterns: DevelopmentPattern[] = []
+  DEVELOPMENT_PATTERNS.forEach(({ pattern, description }, index) => {
+    const matchedLogs = matches[index]
+    if (matchedLogs.length > 0) {
+      patterns.push({
+        pattern,
+        frequency: matchedLogs.length,
+        description,
+        relatedTopics: analyzeConversationTopics(matchedLogs).slice(0, 3).map(t => t.topic)
+      })
+    }
+  })
 
   return patterns.sort((a, b) => b.frequency - a.frequency)
 }
@@ -233,17 +270,18 @@ export function analyzeDevelopmentPatterns(logs: ClaudeChatLog[]): DevelopmentPa
 
 // Calculate average response time for completed conversations
 export function calculateAverageResponseTime(logs: ClaudeChatLog[]): number {
-  const completedLogs = logs.filter(log => log.status === 'completed' && log.completed_at)
-
-  if (completedLogs.length === 0) return 0
+  // Sum and count in one pass instead of filtering into a temporary array
+  let totalTime = 0
+  let completedCount = 0
+  for (const log of logs) {
+    if (log.status !== 'completed' || !log.completed_at) continue
+    totalTime += new Date(log.completed_at).getTime() - new Date(log.interaction_timestamp).getTime()
+    completedCount++
+  }
 
-  const totalTime = completedLogs.reduce((sum, log) => {
-    const start = new Date(log.interaction_timestamp).getTime()
-    const end = new Date(log.completed_at!).getTime()
-    return sum + (end - start)
-  }, 0)
+  if (completedCount === 0) return 0
 
-  return totalTime / completedLogs.length / 1000 / 60 // Return in minutes
+  return totalTime / completedCount / 1000 / 60 // Return in minutes
 }
 
 // Get most active project for a user
@@ -257,13 +295,26 @@ export function getMostActiveProject(logs: ClaudeChatLog[]): { projectId: string
     projectCounts[log.project_id].count++
   })
 
-  const entries = Object.entries(projectCounts)
-  if (entries.length === 0) return null
+  // Single pass for the maximum; the first project wins ties as with the previous stable sort
+  let best: { projectId: string; projectName: string; count: number } | null = null
+  for (const [projectId, data] of Object.entries(projectCounts)) {
+    if (!best || data.count > best.count) {
+      best = { projectId, projectName: data.name, count: data.count }
+    }
+  }
 
-  const [projectId, data] = entries.sort(([,a], [,b]) => b.count - a.count)[0]
-  return { projectId, projectName: data.name, count: data.count }
+  return best
 }
 
+// Time periods and the hours they cover, built once as entries
+const TIME_PERIODS: ReadonlyArray<readonly [string, readonly number[]]> = Object.entries({
+  'Early Morning (6-9)': [6, 7, 8, 9],
+  'Morning (9-12)': [9, 10, 11],
+  'Afternoon (12-17)': [12, 13, 14, 15, 16],
+  'Evening (17-21)': [17, 18, 19, 20],
+  'Night (21-6)': [21, 22, 23, 0, 1, 2, 3, 4, 5]
+})
+
 // Analyze time distribution of user activity
 export function analyzeTimeDistribution(logs: ClaudeChatLog[]): Record<string, number> {
   const hourCounts: Record<number, number> = {}
@@ -274,16 +325,8 @@ export function analyzeTimeDistribution(logs: ClaudeChatLog[]): Record<string, n
   })
 
   // Group into time periods
-  const periods = {
-    'Early Morning (6-9)': [6, 7, 8, 9],
-    'Morning (9-12)': [9, 10, 11],
-    'Afternoon (12-17)': [12, 13, 14, 15, 16],
-    'Evening (17-21)': [17, 18, 19, 20],
-    'Night (21-6)': [21, 22, 23, 0, 1, 2, 3, 4, 5]
-  }
-
   const distribution: Record<string, number> = {}
-  Object.entries(periods).forEach(([period, hours]) => {
+  TIME_PERIODS.forEach(([period, hours]) => {
     distribution[period] = hours.reduce((sum, hour) => sum + (hourCounts[hour] || 0), 0)
   })
 
@@ -305,28 +348,29 @@ export function calculateProductivityScore(logs: ClaudeChatLog[]): number {
   return Math.round((completionRate * 0.7 + activityScore * 0.3) * 100)
 }
 
+// Learning style indicator phrases, all lowercase to match the lowercased queries
+const LEARNING_INDICATORS: ReadonlyArray<readonly [string, readonly string[]]> = Object.entries({
+  'Hands-on Learner': ['example', 'show me', 'how to implement', 'code'],
+  'Conceptual Learner': ['explain', 'why', 'difference', 'concept', 'theory'],
+  'Problem Solver': ['fix', 'debug', 'issue', 'problem', 'error'],
+  'Explorer': ['what if', 'alternative', 'best practice', 'different way']
+})
+
 // Analyze learning patterns from conversation content
 export function analyzeLearningPatterns(logs: ClaudeChatLog[]): {
   learningStyle: string
   focusAreas: string[]
   progressionIndicators: string[]
 } {
-  const learningIndicators = {
-    'Hands-on Learner': ['example', 'show me', 'how to implement', 'code'],
-    'Conceptual Learner': ['explain', 'why', 'difference', 'concept', 'theory'],
-    'Problem Solver': ['fix', 'debug', 'issue', 'problem', 'error'],
-    'Explorer': ['what if', 'alternative', 'best practice', 'different way']
-  }
-
   const content = logs.map(log => log.user_query.toLowerCase()).join(' ')
 
   // Determine learning style
   let dominantStyle = 'Balanced Learner'
   let maxScore = 0
 
-  Object.entries(learningIndicators).forEach(([style, indicators]) => {
+  LEARNING_INDICATORS.forEach(([style, indicators]) => {
     const score = indicators.reduce((sum, indicator) => {
-      return sum + (content.split(indicator).length - 1)
+      return sum + countOccurrences(content, indicator)
     }, 0)
 
     if (score > maxScore) {
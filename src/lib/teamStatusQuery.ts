@@ -0,0 +1,8 @@
+// Shared query settings for the team status hooks
+
+// lib/supabase throws at import when these are missing, so the shared client is only
+// loaded once they are known to be set; otherwise the fetch fails into the mock fallback
+export const SUPABASE_CONFIGURED = Boolean(import.meta.env.VITE_SUPABASE_URL && import.meta.env.VITE_SUPABASE_ANON_KEY)
+
+// Only the columns the team status hooks read; skips audit and installation fields
+export const CONVERSATION_COLUMNS = 'id,user_id,project_id,project_name,user_query,claude_response,interaction_timestamp,status'
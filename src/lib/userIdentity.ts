@@ -0,0 +1,36 @@
+// Known user display names
+const USER_DISPLAY_NAMES: Record<string, string> = {
+  'VishiATChoudhary': 'Vishi Choudhary',
+  'Max': 'Max Akishin',
+  'e3b41869-1444-4bf0-a625-90b0f1d1dffb': 'Anonymous Developer',
+  'teammate_john': 'John Martinez'
+}
+
+export interface UserIdentity {
+  displayName: string
+  initials: string
+}
+
+// Display name and initials per user id. The set of users is small and stable,
+// so each id is formatted once rather than on every refresh.
+const userIdentityCache = new Map<string, UserIdentity>()
+
+export function getUserIdentity(userId: string): UserIdentity {
+  const cached = userIdentityCache.get(userId)
+  if (cached) return cached
+
+  const displayName = USER_DISPLAY_NAMES[userId] ||
+    (userId.includes('test') ? `Test User ${userId.slice(-3)}` :
+     userId.length > 20 ? 'Anonymous Developer' : userId)
+
+  const initials = displayName
+    .split(' ')
+    .map(word => word[0])
+    .join('')
+    .toUpperCase()
+    .slice(0, 2)
+
+  const identity = { displayName, initials }
+  userIdentityCache.set(userId, identity)
+  return identity
+}
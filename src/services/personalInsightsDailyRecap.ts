@@ -89,11 +89,14 @@ Guidelines:
   }
 
   private filterTodaysLogs(logs: ClaudeChatLog[]): ClaudeChatLog[] {
-    const today = new Date().toDateString()
+    // Bounds of the local calendar day, so each log is one parse and two comparisons
+    const now = new Date()
+    const dayStart = new Date(now.getFullYear(), now.getMonth(), now.getDate()).getTime()
+    const dayEnd = new Date(now.getFullYear(), now.getMonth(), now.getDate() + 1).getTime()
     return logs.filter(log => {
       if (!log.interaction_timestamp) return false
-      const timestamp = new Date(log.interaction_timestamp)
-      return timestamp.toDateString() === today
+      const timestamp = Date.parse(log.interaction_timestamp)
+      return timestamp >= dayStart && timestamp < dayEnd
     })
   }
 
@@ -2,6 +2,7 @@ import { supabase } from '@/lib/supabase'
 import usePersonalInsightsStore from '@/stores/usePersonalInsightsStore'
 import type { ClaudeChatLog } from '@/hooks/useSupabase'
 import type { DeveloperProfile } from '@/types/analysis'
+import type { ActivityMetrics } from '@/types/personalInsights'
 import type { DevelopmentEvent, TimelineAnalysis } from '@/hooks/useDevelopmentTimeline'
 import { personalInsightsDailyRecapService } from '@/services/personalInsightsDailyRecap'
 
@@ -75,12 +76,12 @@ export class PersonalInsightsDataService {
   }
 
   // Fetch activity metrics
-  async fetchActivityMetrics(userId: string, timeframe: 'day' | 'week' | 'month' = 'day'): Promise<any> {
+  async fetchActivityMetrics(userId: string, timeframe: 'day' | 'week' | 'month' = 'day'): Promise<ActivityMetrics | null> {
     const store = usePersonalInsightsStore.getState()
     const cacheKey = `activity_metrics_${userId}_${timeframe}`
 
     // Check cache
-    const cached = store.getCachedData<any>(cacheKey)
+    const cached = store.getCachedData<ActivityMetrics>(cacheKey)
     if (cached) {
       return cached
     }
@@ -328,25 +329,24 @@ export class PersonalInsightsDataService {
     })
   }
 
-  private calculateActivityMetrics(logs: ClaudeChatLog[]): any {
+  private calculateActivityMetrics(logs: ClaudeChatLog[]): ActivityMetrics {
     const totalInteractions = logs.length
     const completedInteractions = logs.filter(log => log.status === 'completed').length
     const projectsWorkedOn = new Set(logs.map(log => log.project_id)).size
 
-    // Topic frequency analysis
-    const topics = logs.reduce((acc, log) => {
+    // Topic frequency analysis (a Set keeps first-seen order without buffering duplicates)
+    const topics = new Set<string>()
+    logs.forEach(log => {
       const query = log.user_query?.toLowerCase() || ''
 
-      if (query.includes('react') || query.includes('component')) acc.push('React')
-      if (query.includes('api') || query.includes('endpoint')) acc.push('API Development')
-      if (query.includes('database') || query.includes('sql')) acc.push('Database')
-      if (query.includes('test')) acc.push('Testing')
-      if (query.includes('bug') || query.includes('error')) acc.push('Debugging')
-
-      return acc
-    }, [] as string[])
+      if (query.includes('react') || query.includes('component')) topics.add('React')
+      if (query.includes('api') || query.includes('endpoint')) topics.add('API Development')
+      if (query.includes('database') || query.includes('sql')) topics.add('Database')
+      if (query.includes('test')) topics.add('Testing')
+      if (query.includes('bug') || query.includes('error')) topics.add('Debugging')
+    })
 
-    const topicFrequency = [...new Set(topics)]
+    const topicFrequency = Array.from(topics)
 
     return {
       totalInteractions,
@@ -359,17 +359,18 @@ export class PersonalInsightsDataService {
   }
 
   private calculateAverageResponseTime(logs: ClaudeChatLog[]): number {
-    const completedLogs = logs.filter(log => log.status === 'completed' && log.completed_at)
-
-    if (completedLogs.length === 0) return 0
+    // Sum and count in one pass instead of filtering into a temporary array
+    let totalTime = 0
+    let completedCount = 0
+    for (const log of logs) {
+      if (log.status !== 'completed' || !log.completed_at) continue
+      totalTime += new Date(log.completed_at).getTime() - new Date(log.interaction_timestamp).getTime()
+      completedCount++
+    }
 
-    const totalTime = completedLogs.reduce((sum, log) => {
-      const start = new Date(log.interaction_timestamp).getTime()
-      const end = new Date(log.completed_at!).getTime()
-      return sum + (end - start)
-    }, 0)
+    if (completedCount === 0) return 0
 
-    return Math.round(totalTime / completedLogs.length / 1000) // Return in seconds
+    return Math.round(totalTime / completedCount / 1000) // Return in seconds
   }
 
   private estimateDuration(log: ClaudeChatLog): number {
@@ -395,28 +396,33 @@ export class PersonalInsightsDataService {
     store.setError(null)
 
     try {
-      // Fetch all data in parallel
-      const [logs, metrics, profiles] = await Promise.all([
-        this.fetchUserChatLogs(userId),
-        this.fetchActivityMetrics(userId),
-        this.fetchDeveloperProfiles(userId)
-      ])
-
-      try {
-        const recap = await personalInsightsDailyRecapService.generateDailyRecap({
-          logs,
-          metrics
-        })
-
-        store.setDailySummary(recap)
-      } catch (recapError) {
-        console.error('Failed to build daily recap:', recapError)
-        store.setDailySummary(null)
+      // Fetch all data in parallel, then build the recap from the logs and metrics
+      const buildRecap = async () => {
+        const [logs, metrics] = await Promise.all([
+          this.fetchUserChatLogs(userId),
+          this.fetchActivityMetrics(userId),
+          this.fetchDeveloperProfiles(userId)
+        ])
+
+        try {
+          const recap = await personalInsightsDailyRecapService.generateDailyRecap({
+            logs,
+            metrics
+          })
+
+          store.setDailySummary(recap)
+        } catch (recapError) {
+          console.error('Failed to build daily recap:', recapError)
+          store.setDailySummary(null)
+        }
       }
 
-      // Fetch timeline data
+      // Timeline data does not depend on the recap, so fetch it while the recap is generated
       const timeRange = this.getTimeRangeForStore()
-      await this.fetchTimelineEvents(userId, projectId, timeRange)
+      await Promise.all([
+        buildRecap(),
+        this.fetchTimelineEvents(userId, projectId, timeRange)
+      ])
 
       store.setLastRefresh(new Date())
     } catch (error) {
@@ -40,6 +40,30 @@ export interface TicketSummaryResult {
   key_points: string[]
 }
 
+// Upper bound on per-user analyses in flight, so a large team does not open one
+// OpenAI request per developer at once and trip the rate limit
+const MAX_CONCURRENT_ANALYSES = 4
+
+// Map items through an async function with at most `limit` calls pending; results keep input order
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length)
+  let next = 0
+
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++
+      results[index] = await fn(items[index])
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker))
+  return results
+}
+
 export class SimpleLLMAnalysis {
   private llm: ChatOpenAI
 
@@ -57,28 +81,25 @@ export class SimpleLLMAnalysis {
 
     // Group conversations by user
     const userGroups = conversations.reduce((acc, conv) => {
-      if (!acc[conv.user_id]) {
-        acc[conv.user_id] = []
-      }
-      acc[conv.user_id].push(conv)
+      const group = acc[conv.user_id] ?? (acc[conv.user_id] = [])
+      group.push(conv)
       return acc
     }, {} as Record<string, ConversationData[]>)
 
-    const results: LLMAnalysisResult[] = []
-
-    // Analyze each user's conversations
-    for (const [userId, userConversations] of Object.entries(userGroups)) {
-      try {
-        const analysis = await this.analyzeUserConversations(userId, userConversations)
-        results.push(analysis)
-      } catch (error) {
-        console.error(`Failed to analyze user ${userId}:`, error)
-        // Return fallback analysis
-        results.push(this.createFallbackAnalysis(userId, userConversations))
+    // Analyze users concurrently, a few at a time; results keep the user order
+    return mapWithConcurrency(
+      Object.entries(userGroups),
+      MAX_CONCURRENT_ANALYSES,
+      async ([userId, userConversations]) => {
+        try {
+          return await this.analyzeUserConversations(userId, userConversations)
+        } catch (error) {
+          console.error(`Failed to analyze user ${userId}:`, error)
+          // Return fallback analysis
+          return this.createFallbackAnalysis(userId, userConversations)
+        }
       }
-    }
-
-    return results
+    )
   }
 
   async summarizeTicket(input: {
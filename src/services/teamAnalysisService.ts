@@ -63,6 +63,9 @@ export class TeamAnalysisService {
   private teamInsightParser: StructuredOutputParser<z.infer<typeof TeamInsightSchema>>
   private developerProfileParser: StructuredOutputParser<z.infer<typeof DeveloperProfileSchema>>
   private conversationInsightsParser: StructuredOutputParser<z.infer<typeof ConversationInsightsSchema>>
+  private teamInsightInstructions: string
+  private developerProfileInstructions: string
+  private conversationInsightsInstructions: string
 
   constructor() {
     // Initialize OpenAI model
@@ -77,14 +80,22 @@ export class TeamAnalysisService {
     this.teamInsightParser = StructuredOutputParser.fromZodSchema(TeamInsightSchema)
     this.developerProfileParser = StructuredOutputParser.fromZodSchema(DeveloperProfileSchema)
     this.conversationInsightsParser = StructuredOutputParser.fromZodSchema(ConversationInsightsSchema)
+
+    // Format instructions serialize the whole schema, so render them once per parser
+    this.teamInsightInstructions = this.teamInsightParser.getFormatInstructions()
+    this.developerProfileInstructions = this.developerProfileParser.getFormatInstructions()
+    this.conversationInsightsInstructions = this.conversationInsightsParser.getFormatInstructions()
   }
 
-  async analyzeTeamHealth(request: TeamAnalysisRequest): Promise<AnalysisResult<TeamInsight>> {
+  async analyzeTeamHealth(
+    request: TeamAnalysisRequest,
+    preloadedConversations?: ClaudeChatLog[]
+  ): Promise<AnalysisResult<TeamInsight>> {
     const startTime = Date.now()
 
     try {
-      // Fetch conversation data
-      const conversations = await this.fetchConversations(request)
+      // Fetch conversation data unless the caller already has it
+      const conversations = preloadedConversations ?? await this.fetchConversations(request)
 
       if (conversations.length === 0) {
         return {
@@ -125,8 +136,6 @@ export class TeamAnalysisService {
         {format_instructions}
       `)
 
-      const formatInstructions = this.teamInsightParser.getFormatInstructions()
-
       const chain = prompt.pipe(this.llm).pipe(this.teamInsightParser)
 
       const result = await chain.invoke({
@@ -134,7 +143,7 @@ export class TeamAnalysisService {
         team_size: context.project_context.team_size,
         analysis_period: request.time_range ? `${request.time_range.start_date} to ${request.time_range.end_date}` : 'Recent activity',
         conversations: this.formatConversationsForPrompt(context.conversations),
-        format_instructions: formatInstructions
+        format_instructions: this.teamInsightInstructions
       })
 
       // Enrich result with metadata
@@ -168,7 +177,10 @@ export class TeamAnalysisService {
     }
   }
 
-  async analyzeDeveloperProfile(request: TeamAnalysisRequest): Promise<AnalysisResult<DeveloperProfile>> {
+  async analyzeDeveloperProfile(
+    request: TeamAnalysisRequest,
+    preloadedConversations?: ClaudeChatLog[]
+  ): Promise<AnalysisResult<DeveloperProfile>> {
     const startTime = Date.now()
 
     try {
@@ -176,7 +188,8 @@ export class TeamAnalysisService {
         throw new Error('User ID is required for developer profile analysis')
       }
 
-      const conversations = await this.fetchConversations(request)
+      // Callers that already hold this user's conversations can skip the fetch
+      const conversations = preloadedConversations ?? await this.fetchConversations(request)
 
       if (conversations.length === 0) {
         return {
@@ -215,8 +228,6 @@ export class TeamAnalysisService {
         {format_instructions}
       `)
 
-      const formatInstructions = this.developerProfileParser.getFormatInstructions()
-
       const chain = prompt.pipe(this.llm).pipe(this.developerProfileParser)
 
       const result = await chain.invoke({
@@ -224,7 +235,7 @@ export class TeamAnalysisService {
         analysis_period: request.time_range ? `${request.time_range.start_date} to ${request.time_range.end_date}` : 'Recent activity',
         conversation_count: conversations.length,
         conversations: this.formatConversationsForPrompt(context.conversations),
-        format_instructions: formatInstructions
+        format_instructions: this.developerProfileInstructions
       })
 
       // Enrich result with metadata
@@ -258,7 +269,7 @@ export class TeamAnalysisService {
     }
   }
 
-  private async fetchConversations(request: TeamAnalysisRequest): Promise<ClaudeChatLog[]> {
+  async fetchConversations(request: TeamAnalysisRequest): Promise<ClaudeChatLog[]> {
     let query = supabase
       .from('claude_chat_logs')
       .select('*')
@@ -352,8 +363,6 @@ Timestamp: ${conv.timestamp}
       {format_instructions}
     `)
 
-    const formatInstructions = this.conversationInsightsParser.getFormatInstructions()
-
     try {
       const chain = prompt.pipe(this.llm).pipe(this.conversationInsightsParser)
 
@@ -361,7 +370,7 @@ Timestamp: ${conv.timestamp}
         conversations.map(async (conv) => {
           const result = await chain.invoke({
             conversations: this.formatSingleConversation(conv),
-            format_instructions: formatInstructions
+            format_instructions: this.conversationInsightsInstructions
           })
           return result
         })
@@ -379,4 +388,7 @@ Timestamp: ${conv.timestamp}
 Response: ${conversation.claude_response || 'No response'}
 Timestamp: ${conversation.interaction_timestamp}`
   }
-}
\ No newline at end of file
+}
+
+// Shared instance so every hook reuses one model client and set of parsers
+export const teamAnalysisService = new TeamAnalysisService()
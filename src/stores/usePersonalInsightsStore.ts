@@ -1,7 +1,7 @@
 import { create } from 'zustand'
-import { devtools, persist } from 'zustand/middleware'
+import { createJSONStorage, devtools, persist, type StateStorage } from 'zustand/middleware'
 import type { DeveloperProfile } from '@/types/analysis'
-import type { DailyRecapSummary } from '@/types/personalInsights'
+import type { ActivityMetrics, DailyRecapSummary } from '@/types/personalInsights'
 import type { ClaudeChatLog } from '@/hooks/useSupabase'
 import type { DevelopmentEvent, TimelineAnalysis } from '@/hooks/useDevelopmentTimeline'
 
@@ -20,7 +20,7 @@ interface PersonalInsightsState {
 
   // Cached data from Supabase
   userLogs: ClaudeChatLog[] | null
-  activityMetrics: any | null
+  activityMetrics: ActivityMetrics | null
   developerProfiles: DeveloperProfile[] | null
   currentProfile: DeveloperProfile | null
   dailySummary: DailyRecapSummary | null
@@ -61,7 +61,7 @@ interface PersonalInsightsState {
   setUserId: (userId: string) => void
   setProjectId: (projectId: string) => void
   setUserLogs: (logs: ClaudeChatLog[]) => void
-  setActivityMetrics: (metrics: any) => void
+  setActivityMetrics: (metrics: ActivityMetrics) => void
   setDeveloperProfiles: (profiles: DeveloperProfile[]) => void
   setCurrentProfile: (profile: DeveloperProfile | null) => void
   setDailySummary: (summary: DailyRecapSummary | null) => void
@@ -92,6 +92,23 @@ interface PersonalInsightsState {
   runLLMAnalysis: (type: 'all' | 'profile' | 'timeline' | 'digest') => Promise<void>
 }
 
+// persist serializes the settings slice after every state change, including the frequent
+// data and cache updates that never touch settings. Skip the synchronous localStorage
+// write when the serialized settings are identical to what was last written.
+const lastPersisted = new Map<string, string>()
+const settingsStorage: StateStorage = {
+  getItem: (name) => localStorage.getItem(name),
+  setItem: (name, value) => {
+    if (lastPersisted.get(name) === value) return
+    lastPersisted.set(name, value)
+    localStorage.setItem(name, value)
+  },
+  removeItem: (name) => {
+    lastPersisted.delete(name)
+    localStorage.removeItem(name)
+  }
+}
+
 // Create the store
 const usePersonalInsightsStore = create<PersonalInsightsState>()(
   devtools(
@@ -278,6 +295,7 @@ const usePersonalInsightsStore = create<PersonalInsightsState>()(
       }),
       {
         name: 'personal-insights-store',
+        storage: createJSONStorage(() => settingsStorage),
         // Only persist settings, not data
         partialize: (state) => ({
           enableLLMAnalysis: state.enableLLMAnalysis,
@@ -76,3 +76,13 @@ export interface DigestOptions {
   maxConversations?: number // Default: 50
   includeIncomplete?: boolean // Include pending conversations
 }
+
+// Aggregated activity metrics for a user over a timeframe
+export interface ActivityMetrics {
+  totalInteractions: number
+  completedInteractions: number
+  projectsWorkedOn: number
+  topicFrequency: string[] // Distinct topics in first-seen order
+  completionRate: number // 0-1
+  averageResponseTime: number // in seconds
+}
@@ -0,0 +1,50 @@
+-- Bulk insert function for claude_chat_logs
+-- Run this migration in your Supabase SQL editor after analysis_tables.sql
+
+-- Inserts a JSON array of chat logs in one statement and one transaction, so a
+-- whole upload either lands or fails together. Called through PostgREST as
+-- supabase.rpc('insert_chat_logs_bulk', { logs }). id and the audit timestamps are
+-- left to their column defaults. Returns the number of rows inserted.
+-- The function runs as SECURITY INVOKER (the default), so the caller's grants and
+-- any RLS policies on claude_chat_logs still apply to the inserted rows.
+CREATE OR REPLACE FUNCTION insert_chat_logs_bulk(logs JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  inserted_count INTEGER;
+BEGIN
+  INSERT INTO claude_chat_logs (
+    user_query,
+    claude_response,
+    user_id,
+    project_id,
+    interaction_timestamp,
+    anonymous_user_id,
+    project_name,
+    installation_id,
+    status,
+    completed_at
+  )
+  SELECT
+    user_query,
+    claude_response,
+    user_id,
+    project_id,
+    interaction_timestamp,
+    anonymous_user_id,
+    project_name,
+    installation_id,
+    status,
+    completed_at
+  FROM jsonb_populate_recordset(NULL::claude_chat_logs, logs);
+
+  GET DIAGNOSTICS inserted_count = ROW_COUNT;
+  RETURN inserted_count;
+END;
+$$;
+
+-- Only the service role may call it; the generator script uses SUPABASE_SERVICE_KEY
+-- and falls back to batched inserts when the function is missing or not permitted
+REVOKE EXECUTE ON FUNCTION insert_chat_logs_bulk(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION insert_chat_logs_bulk(JSONB) TO service_role;
@@ -0,0 +1,27 @@
+-- Composite indexes for the claude_chat_logs access paths used by the app
+-- Run this migration in your Supabase SQL editor after analysis_tables.sql
+
+-- Almost every query filters on project_id and/or user_id and then orders by
+-- interaction_timestamp. The single-column indexes from analysis_tables.sql can
+-- satisfy the filter or the ordering, but not both, so Postgres still sorts the
+-- matching rows. These indexes return them already ordered and let LIMIT stop early.
+
+-- Project timelines and project chat analysis: WHERE project_id = ? ORDER BY interaction_timestamp
+CREATE INDEX IF NOT EXISTS idx_claude_chat_logs_project_timestamp
+  ON claude_chat_logs(project_id, interaction_timestamp DESC);
+
+-- Personal insights, digests and daily recaps: WHERE user_id = ? [AND interaction_timestamp >= ?]
+CREATE INDEX IF NOT EXISTS idx_claude_chat_logs_user_timestamp
+  ON claude_chat_logs(user_id, interaction_timestamp DESC);
+
+-- Per-developer views scoped to a project: WHERE project_id = ? AND user_id = ?
+CREATE INDEX IF NOT EXISTS idx_claude_chat_logs_project_user_timestamp
+  ON claude_chat_logs(project_id, user_id, interaction_timestamp DESC);
+
+-- On a large, live table, run each CREATE INDEX on its own as
+-- CREATE INDEX CONCURRENTLY ... to avoid blocking inserts while it builds.
+-- CONCURRENTLY cannot run inside a transaction, which is why it is not used above.
+
+-- Verify with EXPLAIN ANALYZE, e.g.:
+-- EXPLAIN ANALYZE SELECT * FROM claude_chat_logs
+--   WHERE project_id = 'code-lens-flow' ORDER BY interaction_timestamp DESC LIMIT 100;
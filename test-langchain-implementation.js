@@ -5,15 +5,23 @@
  * Run with: node test-langchain-implementation.js
  */
 
-const path = require('path');
-const fs = require('fs');
+import { execSync } from 'child_process';
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+// The package is an ES module, so resolve paths from this file's URL
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+
+// Section divider, built once and reused
+const DIVIDER = '='.repeat(40);
 
 console.log('🧪 Testing LangChain Implementation\n');
-console.log('='.repeat(40));
+console.log(DIVIDER);
 
 // Test 1: Check if required packages are installed
 console.log('\n✅ Test 1: Checking npm packages...');
-const packageJson = require('./package.json');
+const packageJson = JSON.parse(fs.readFileSync(path.join(__dirname, 'package.json'), 'utf8'));
 const requiredPackages = ['@langchain/core', '@langchain/openai', 'zod'];
 const missingPackages = [];
 
@@ -59,7 +67,6 @@ if (missingFiles.length > 0) {
 
 // Test 3: Check TypeScript compilation
 console.log('\n✅ Test 3: Checking TypeScript compilation...');
-const { execSync } = require('child_process');
 try {
   execSync('npx tsc --noEmit', { stdio: 'pipe' });
   console.log('  ✓ TypeScript compilation successful');
@@ -135,9 +142,9 @@ if (!securityIssues) {
 }
 
 // Summary
-console.log('\n' + '='.repeat(40));
+console.log('\n' + DIVIDER);
 console.log('\n📊 SUMMARY:');
-console.log('='.repeat(40));
+console.log(DIVIDER);
 
 const issues = [];
 if (missingPackages.length > 0) issues.push('Missing npm packages');
@@ -159,4 +166,4 @@ if (issues.length === 0) {
   console.log('\nPlease fix these issues before proceeding.');
 }
 
-console.log('\n' + '='.repeat(40));
+console.log('\n' + DIVIDER);